@@ -0,0 +1,65 @@
+#
+#   MIT License
+#
+#   Copyright (c) 2023, Mattias Aabmets
+#
+#   The contents of this file are subject to the terms and conditions defined in the License.
+#   You may not use, modify, or distribute this file except in compliance with the License.
+#
+#   SPDX-License-Identifier: MIT
+#
+import time
+import asyncio
+from kubernetes_asyncio import client
+from kupydo.models import ConfigMap
+
+
+OBJECT_COUNT = 10_000
+
+
+def render_with_v1_objects(api: client.ApiClient, model: ConfigMap) -> dict:
+    v = model.values
+    obj = client.V1ConfigMap(
+        api_version="v1",
+        kind="ConfigMap",
+        metadata=client.V1ObjectMeta(
+            name=v.name,
+            namespace=v.namespace,
+            annotations=v.annotations,
+            labels=v.labels
+        ),
+        immutable=v.immutable,
+        binary_data=v.binary_data,
+        data=v.data
+    )
+    return api.sanitize_for_serialization(obj.to_dict())
+
+
+def render_with_direct_dicts(api: client.ApiClient, model: ConfigMap) -> dict:
+    return api.sanitize_for_serialization(model._to_dict())
+
+
+def render_direct_dicts_only(_: client.ApiClient, model: ConfigMap) -> dict:
+    return model._to_dict()
+
+
+async def main() -> None:
+    models = [
+        ConfigMap(
+            name=f"config-{i}",
+            namespace="default",
+            labels={"app": "bench", "index": str(i)},
+            data={f"key-{k}": f"value-{k}" for k in range(10)}
+        ) for i in range(OBJECT_COUNT)
+    ]
+    async with client.ApiClient(client.Configuration()) as api:
+        for func in [render_with_v1_objects, render_with_direct_dicts, render_direct_dicts_only]:
+            start = time.perf_counter()
+            for model in models:
+                func(api, model)
+            elapsed = (time.perf_counter() - start) * 1000
+            print(f"{func.__name__:<28}{OBJECT_COUNT} objects in {elapsed:.1f} ms")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
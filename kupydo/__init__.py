@@ -10,3 +10,5 @@
 #
 from kupydo.internal.registry import GlobalRegistry
 from kupydo.internal.client import ApiClient
+from kupydo.internal.api_ops import RetryPolicy
+from kupydo.internal.fanout import ClusterResult, apply_to_contexts
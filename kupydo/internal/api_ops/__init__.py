@@ -0,0 +1,71 @@
+#
+#   MIT License
+#
+#   Copyright (c) 2023, Mattias Aabmets
+#
+#   The contents of this file are subject to the terms and conditions defined in the License.
+#   You may not use, modify, or distribute this file except in compliance with the License.
+#
+#   SPDX-License-Identifier: MIT
+#
+from .scheduler import *
+from .connection import *
+from .rate_limiter import *
+from .retry_policy import *
+from .session_pool import *
+from .single_flight import *
+from .pager import *
+from .watcher import *
+from .informer import *
+from .pruner import *
+from .metadata import *
+from .validation import *
+from .apply_report import *
+from .waiter import *
+from .rollout import *
+from .discovery import *
+from .dynamic import *
+
+
+__all__ = [
+	"Scopes",
+	"is_namespaced",
+	"DependencyScheduler",
+	"ConnectionSettings",
+	"create_session",
+	"TokenBucket",
+	"RetryBudget",
+	"RetryPolicy",
+	"SessionPool",
+	"SingleFlight",
+	"paginate_resource",
+	"list_resource",
+	"WatchEvent",
+	"stream_watch_events",
+	"watch_resource",
+	"Informer",
+	"OWNER_LABEL",
+	"PruneScope",
+	"resolve_deployment_id",
+	"stamp_owner",
+	"owner_selector",
+	"scoped_key",
+	"listable_kinds",
+	"prune_phases",
+	"PARTIAL_METADATA",
+	"PARTIAL_METADATA_LIST",
+	"metadata_query",
+	"metadata_actions",
+	"list_all_action",
+	"ValidationReport",
+	"ApplyReport",
+	"Condition",
+	"wait_for_keys",
+	"RolloutStatus",
+	"rollout_status",
+	"wait_rollouts",
+	"DISCOVERY_CACHE_DIR",
+	"ApiResource",
+	"DiscoveryCache",
+	"DynamicApi"
+]
@@ -0,0 +1,34 @@
+#
+#   MIT License
+#
+#   Copyright (c) 2023, Mattias Aabmets
+#
+#   The contents of this file are subject to the terms and conditions defined in the License.
+#   You may not use, modify, or distribute this file except in compliance with the License.
+#
+#   SPDX-License-Identifier: MIT
+#
+from __future__ import annotations
+from dataclasses import dataclass, field
+from kupydo.internal.response import Response
+from kupydo.internal.types import *
+
+
+__all__ = ["ApplyReport"]
+
+
+@dataclass
+class ApplyReport:
+    applied: dict[ObjectKey, Response] = field(default_factory=dict)
+    pruned: dict[ObjectKey, Response] = field(default_factory=dict)
+
+    @property
+    def failed(self) -> dict[ObjectKey, Response]:
+        return {
+            k: r for results in (self.applied, self.pruned)
+            for k, r in results.items() if r.error is not None
+        }
+
+    @property
+    def ok(self) -> bool:
+        return not self.failed
@@ -0,0 +1,63 @@
+#
+#   MIT License
+#
+#   Copyright (c) 2023, Mattias Aabmets
+#
+#   The contents of this file are subject to the terms and conditions defined in the License.
+#   You may not use, modify, or distribute this file except in compliance with the License.
+#
+#   SPDX-License-Identifier: MIT
+#
+import ssl
+import aiohttp
+from dataclasses import dataclass
+from kubernetes_asyncio import client
+
+
+__all__ = ["ConnectionSettings", "create_session"]
+
+
+@dataclass(frozen=True)
+class ConnectionSettings:
+    pool_size: int = 100
+    pool_size_per_host: int = 0
+    keepalive_timeout: float = 15.0
+    dns_cache_ttl: int | None = 10
+
+    def ssl_context(self, config: client.Configuration) -> ssl.SSLContext:
+        context = ssl.create_default_context(cafile=config.ssl_ca_cert)
+        if config.cert_file:
+            context.load_cert_chain(config.cert_file, keyfile=config.key_file)
+        if not config.verify_ssl:
+            context.check_hostname = False
+            context.verify_mode = ssl.CERT_NONE
+        if getattr(config, "disable_strict_ssl_verification", False):
+            context.verify_flags &= ~ssl.VERIFY_X509_STRICT
+        return context
+
+    def connector(self, config: client.Configuration) -> aiohttp.TCPConnector:
+        return aiohttp.TCPConnector(
+            limit=self.pool_size,
+            limit_per_host=self.pool_size_per_host,
+            keepalive_timeout=self.keepalive_timeout,
+            ttl_dns_cache=self.dns_cache_ttl,
+            use_dns_cache=self.dns_cache_ttl is not None,
+            ssl=self.ssl_context(config)
+        )
+
+
+async def create_session(config: client.Configuration, settings: ConnectionSettings) -> client.ApiClient:
+    session = client.ApiClient(config)
+    rest_client = session.rest_client
+    await rest_client.pool_manager.close()
+    try:
+        connector = settings.connector(config)
+    except BaseException:
+        await session.close()
+        raise
+    rest_client.pool_manager = aiohttp.ClientSession(
+        connector=connector,
+        trust_env=True,
+        read_bufsize=2 ** 21
+    )
+    return session
@@ -0,0 +1,140 @@
+#
+#   MIT License
+#
+#   Copyright (c) 2023, Mattias Aabmets
+#
+#   The contents of this file are subject to the terms and conditions defined in the License.
+#   You may not use, modify, or distribute this file except in compliance with the License.
+#
+#   SPDX-License-Identifier: MIT
+#
+from __future__ import annotations
+import re
+import time
+import orjson
+import asyncio
+from pathlib import Path
+from dataclasses import dataclass
+from kubernetes_asyncio import client
+from kubernetes_asyncio.client.rest import RESTResponse
+from kupydo.internal.types import *
+from kupydo.internal import errors
+
+
+__all__ = [
+    "DISCOVERY_CACHE_DIR",
+    "ApiResource",
+    "DiscoveryCache"
+]
+
+
+DISCOVERY_CACHE_DIR = Path("~/.kube/cache/discovery").expanduser()
+
+
+@dataclass(frozen=True)
+class ApiResource:
+    group_version: str
+    name: str
+    kind: str
+    namespaced: bool
+
+    def path(self, namespace: str = None, name: str = None) -> str:
+        prefix = "/apis" if "/" in self.group_version else "/api"
+        scope = f"/namespaces/{namespace}" if namespace and self.namespaced else ""
+        suffix = f"/{name}" if name else ""
+        return f"{prefix}/{self.group_version}{scope}/{self.name}{suffix}"
+
+
+_Resources = dict[str, ApiResource]
+
+
+class DiscoveryCache:
+    _memory: dict[tuple[str, str], tuple[float, _Resources]] = dict()
+    _inflight: dict[tuple[str, str], asyncio.Task] = dict()
+
+    def __init__(self,
+                 api_client: client.ApiClient,
+                 cache_dir: Path = DISCOVERY_CACHE_DIR,
+                 ttl: float = 6 * 3600
+                 ) -> None:
+        self._api_client = api_client
+        self._host = api_client.configuration.host
+        self._cache_dir = cache_dir
+        self._ttl = ttl
+
+    @classmethod
+    def clear(cls) -> None:
+        cls._memory.clear()
+
+    def _cache_file(self, group_version: str) -> Path:
+        host_dir = re.sub(r"[^\w.]", "_", re.sub(r"^https?://", "", self._host))
+        return self._cache_dir / host_dir / group_version / "serverresources.json"
+
+    @staticmethod
+    def _parse(data: RawDict) -> _Resources:
+        group_version = data["groupVersion"]
+        return {
+            res["kind"]: ApiResource(group_version, res["name"], res["kind"], res["namespaced"])
+            for res in data.get("resources") or list()
+            if "/" not in res["name"]
+        }
+
+    def _read_disk(self, group_version: str) -> tuple[float, _Resources] | None:
+        path = self._cache_file(group_version)
+        try:
+            expires_at = path.stat().st_mtime + self._ttl
+            if expires_at <= time.time():
+                return None
+            return expires_at, self._parse(orjson.loads(path.read_bytes()))
+        except (OSError, KeyError, orjson.JSONDecodeError):
+            return None
+
+    def _write_disk(self, group_version: str, data: bytes) -> None:
+        path = self._cache_file(group_version)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            temp = path.with_suffix(".tmp")
+            temp.write_bytes(data)
+            temp.replace(path)
+        except OSError:
+            pass
+
+    async def _fetch(self, group_version: str) -> tuple[float, _Resources]:
+        prefix = "/apis" if "/" in group_version else "/api"
+        response = await self._api_client.call_api(
+            f"{prefix}/{group_version}", "GET",
+            header_params=dict(Accept="application/json"),
+            auth_settings=["BearerToken"],
+            _return_http_data_only=True,
+            _preload_content=False
+        )
+        async with response:
+            data = await response.read()
+        if not 200 <= response.status <= 299:
+            raise client.ApiException(http_resp=RESTResponse(response, data))
+        self._write_disk(group_version, data)
+        return time.time() + self._ttl, self._parse(orjson.loads(data))
+
+    async def _load(self, group_version: str, refresh: bool) -> _Resources:
+        key = (self._host, group_version)
+        entry = None if refresh else self._memory.get(key)
+        if entry is None or entry[0] <= time.time():
+            entry = None if refresh else self._read_disk(group_version)
+            if entry is None:
+                if key not in self._inflight:
+                    self._inflight[key] = asyncio.create_task(self._fetch(group_version))
+                try:
+                    entry = await asyncio.shield(self._inflight[key])
+                finally:
+                    if self._inflight.get(key) is not None and self._inflight[key].done():
+                        del self._inflight[key]
+            self._memory[key] = entry
+        return entry[1]
+
+    async def resolve(self, api_version: str, kind: str) -> ApiResource:
+        resource = (await self._load(api_version, refresh=False)).get(kind)
+        if resource is None:
+            resource = (await self._load(api_version, refresh=True)).get(kind)
+        if resource is None:
+            raise errors.UnknownKindError(api_version, kind)
+        return resource
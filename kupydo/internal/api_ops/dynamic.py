@@ -0,0 +1,80 @@
+#
+#   MIT License
+#
+#   Copyright (c) 2023, Mattias Aabmets
+#
+#   The contents of this file are subject to the terms and conditions defined in the License.
+#   You may not use, modify, or distribute this file except in compliance with the License.
+#
+#   SPDX-License-Identifier: MIT
+#
+from __future__ import annotations
+import orjson
+from kubernetes_asyncio import client
+from kubernetes_asyncio.client.rest import RESTResponse
+from kupydo.internal.base import *
+from kupydo.internal.types import *
+from .discovery import DiscoveryCache
+from .metadata import PARTIAL_METADATA, PARTIAL_METADATA_LIST, metadata_query
+
+
+__all__ = ["DynamicApi"]
+
+
+class DynamicApi:
+    def __init__(self, api_client: client.ApiClient, namespace: str = "default") -> None:
+        self.api_client = api_client
+        self.namespace = namespace
+        self.discovery = DiscoveryCache(api_client)
+
+    async def _request(self,
+                       api_version: str,
+                       kind: str,
+                       method: str,
+                       name: str = None,
+                       namespace: str = None,
+                       body: RawDict = None,
+                       accept: str = "application/json",
+                       _content_type: str = "application/json",
+                       _preload_content: bool = True,
+                       **kwargs):
+        resource = await self.discovery.resolve(api_version, kind)
+        if resource.namespaced and namespace is None and (name or body is not None):
+            namespace = self.namespace
+        if body is not None and not resource.namespaced:
+            metadata = {k: v for k, v in body.get("metadata", dict()).items() if k != "namespace"}
+            body = dict(body, metadata=metadata)
+        response = await self.api_client.call_api(
+            resource.path(namespace, name), method,
+            query_params=metadata_query(**kwargs),
+            header_params={"Accept": accept, "Content-Type": _content_type},
+            body=body,
+            auth_settings=["BearerToken"],
+            _return_http_data_only=True,
+            _preload_content=False
+        )
+        if not _preload_content:
+            return response
+        async with response:
+            data = await response.read()
+        if not 200 <= response.status <= 299:
+            raise client.ApiException(http_resp=RESTResponse(response, data))
+        return orjson.loads(data)
+
+    def actions(self, api_version: str, kind: str) -> KupydoApiActions:
+        def bind(method: str, accept: str = "application/json") -> AsyncCallable:
+            async def action(**kwargs):
+                return await self._request(api_version, kind, method, accept=accept, **kwargs)
+            return action
+
+        return KupydoApiActions(
+            create=bind("POST"),
+            delete=bind("DELETE"),
+            read=bind("GET"),
+            replace=bind("PUT"),
+            patch=bind("PATCH"),
+            list=bind("GET"),
+            read_metadata=bind("GET", f"{PARTIAL_METADATA}, application/json"),
+            list_metadata=bind("GET", f"{PARTIAL_METADATA_LIST}, application/json"),
+            list_all=bind("GET")
+        )
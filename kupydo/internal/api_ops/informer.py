@@ -0,0 +1,112 @@
+#
+#   MIT License
+#
+#   Copyright (c) 2023, Mattias Aabmets
+#
+#   The contents of this file are subject to the terms and conditions defined in the License.
+#   You may not use, modify, or distribute this file except in compliance with the License.
+#
+#   SPDX-License-Identifier: MIT
+#
+from __future__ import annotations
+import asyncio
+from aiohttp import ClientError
+from kubernetes_asyncio.client import ApiException
+from kupydo.internal.types import *
+from .pager import list_resource
+from .watcher import stream_watch_events
+
+
+__all__ = ["Informer"]
+
+
+class Informer:
+    def __init__(self, list_func: AsyncCallable, namespace: str = None, resync_delay: float = 1.0) -> None:
+        self._list_func = list_func
+        self._namespace = dict(namespace=namespace) if namespace else dict()
+        self._resync_delay = resync_delay
+        self._store: dict[tuple[str | None, str], RawDict] = dict()
+        self._resource_version: str | None = None
+        self._synced = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+    @property
+    def synced(self) -> bool:
+        running = self._task is not None and not self._task.done()
+        return running and self._synced.is_set()
+
+    def get(self, name: str, namespace: str = None) -> RawDict | None:
+        namespace = namespace or self._namespace.get("namespace")
+        return self._store.get((namespace, name))
+
+    def items(self) -> list[RawDict]:
+        return list(self._store.values())
+
+    async def start(self, wait: bool = True) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+        if wait:
+            await self.wait_synced()
+
+    async def wait_synced(self) -> None:
+        waiter = asyncio.create_task(self._synced.wait())
+        done, _ = await asyncio.wait(
+            [waiter, self._task],
+            return_when=asyncio.FIRST_COMPLETED
+        )
+        if waiter not in done:
+            waiter.cancel()
+            self._task.result()
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+            self._synced.clear()
+
+    async def _list(self) -> None:
+        items, self._resource_version = await list_resource(self._list_func, **self._namespace)
+        self._store = {self._object_key(item): item for item in items}
+        self._synced.set()
+
+    @staticmethod
+    def _object_key(obj: RawDict) -> tuple[str | None, str]:
+        metadata = obj["metadata"]
+        return metadata.get("namespace"), metadata["name"]
+
+    def _handle(self, event: RawDict) -> bool:
+        obj = event.get("object", dict())
+        match event.get("type"):
+            case "ADDED" | "MODIFIED":
+                self._store[self._object_key(obj)] = obj
+            case "DELETED":
+                self._store.pop(self._object_key(obj), None)
+            case "ERROR":
+                if obj.get("code") == 410:
+                    return False
+                raise ApiException(status=obj.get("code"), reason=obj.get("reason"))
+        if version := obj.get("metadata", dict()).get("resourceVersion"):
+            self._resource_version = version
+        return True
+
+    async def _run(self) -> None:
+        try:
+            await self._list()
+            while True:
+                try:
+                    async for event in stream_watch_events(
+                            self._list_func,
+                            resource_version=self._resource_version,
+                            **self._namespace):
+                        if not self._handle(event):
+                            await self._list()
+                            break
+                except ApiException as ex:
+                    if ex.status != 410:
+                        raise
+                    await self._list()
+                except (ClientError, asyncio.TimeoutError):
+                    await asyncio.sleep(self._resync_delay)
+        finally:
+            self._synced.clear()
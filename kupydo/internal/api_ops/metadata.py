@@ -0,0 +1,83 @@
+#
+#   MIT License
+#
+#   Copyright (c) 2023, Mattias Aabmets
+#
+#   The contents of this file are subject to the terms and conditions defined in the License.
+#   You may not use, modify, or distribute this file except in compliance with the License.
+#
+#   SPDX-License-Identifier: MIT
+#
+from __future__ import annotations
+from typing import Type, Any
+from kubernetes_asyncio import client
+from kupydo.internal.base import *
+from kupydo.internal.types import *
+
+
+__all__ = [
+    "PARTIAL_METADATA",
+    "PARTIAL_METADATA_LIST",
+    "metadata_query",
+    "metadata_actions",
+    "list_all_action"
+]
+
+
+PARTIAL_METADATA = "application/json;as=PartialObjectMetadata;g=meta.k8s.io;v=v1"
+PARTIAL_METADATA_LIST = "application/json;as=PartialObjectMetadataList;g=meta.k8s.io;v=v1"
+
+_QUERY_NAMES = dict(
+    _continue="continue",
+    limit="limit",
+    label_selector="labelSelector",
+    field_selector="fieldSelector",
+    resource_version="resourceVersion",
+    timeout_seconds="timeoutSeconds",
+    allow_watch_bookmarks="allowWatchBookmarks",
+    watch="watch",
+    field_manager="fieldManager",
+    force="force",
+    dry_run="dryRun",
+    propagation_policy="propagationPolicy",
+    grace_period_seconds="gracePeriodSeconds"
+)
+
+
+def metadata_query(**kwargs: Any) -> list[tuple[str, Any]]:
+    return [
+        (_QUERY_NAMES[key], value)
+        for key, value in kwargs.items()
+        if key in _QUERY_NAMES and value is not None
+    ]
+
+
+async def _request(api_client: client.ApiClient, path: str, accept: str, **kwargs):
+    return await api_client.call_api(
+        path, "GET",
+        query_params=metadata_query(**kwargs),
+        header_params=dict(Accept=accept),
+        auth_settings=["BearerToken"],
+        _return_http_data_only=True,
+        _preload_content=False
+    )
+
+
+def metadata_actions(api_client: client.ApiClient,
+                     model_cls: Type[KupydoBaseModel]
+                     ) -> tuple[AsyncCallable, AsyncCallable]:
+    async def read_metadata(name: str, namespace: str = None, **kwargs):
+        path = f"{model_cls._resource_path(namespace)}/{name}"
+        return await _request(api_client, path, f"{PARTIAL_METADATA}, application/json", **kwargs)
+
+    async def list_metadata(namespace: str = None, **kwargs):
+        path = model_cls._resource_path(namespace)
+        return await _request(api_client, path, f"{PARTIAL_METADATA_LIST}, application/json", **kwargs)
+
+    return read_metadata, list_metadata
+
+
+def list_all_action(api_client: client.ApiClient, model_cls: Type[KupydoBaseModel]) -> AsyncCallable:
+    async def list_all(**kwargs):
+        return await _request(api_client, model_cls._resource_path(), "application/json", **kwargs)
+    return list_all
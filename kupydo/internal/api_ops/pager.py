@@ -0,0 +1,43 @@
+#
+#   MIT License
+#
+#   Copyright (c) 2023, Mattias Aabmets
+#
+#   The contents of this file are subject to the terms and conditions defined in the License.
+#   You may not use, modify, or distribute this file except in compliance with the License.
+#
+#   SPDX-License-Identifier: MIT
+#
+from typing import AsyncIterator
+from kupydo.internal.base import KupydoBaseModel
+from kupydo.internal.types import AsyncCallable, RawDict
+
+
+__all__ = ["paginate_resource", "list_resource"]
+
+
+async def paginate_resource(list_func: AsyncCallable,
+                            page_size: int = 500,
+                            **kwargs) -> AsyncIterator[tuple[list[RawDict], RawDict]]:
+    token = None
+    while True:
+        if token:
+            kwargs.update(_continue=token)
+        data = await KupydoBaseModel._invoke(list_func, True, limit=page_size, **kwargs)
+        api_version, kind = data.get("apiVersion"), data.get("kind", "").removesuffix("List")
+        items = data.get("items") or list()
+        for item in items:
+            item.setdefault("apiVersion", api_version)
+            item.setdefault("kind", kind)
+        metadata = data.get("metadata", dict())
+        yield items, metadata
+        if not (token := metadata.get("continue")):
+            break
+
+
+async def list_resource(list_func: AsyncCallable, **kwargs) -> tuple[list[RawDict], str]:
+    items, resource_version = list(), None
+    async for page, metadata in paginate_resource(list_func, **kwargs):
+        items.extend(page)
+        resource_version = resource_version or metadata["resourceVersion"]
+    return items, resource_version
@@ -0,0 +1,111 @@
+#
+#   MIT License
+#
+#   Copyright (c) 2023, Mattias Aabmets
+#
+#   The contents of this file are subject to the terms and conditions defined in the License.
+#   You may not use, modify, or distribute this file except in compliance with the License.
+#
+#   SPDX-License-Identifier: MIT
+#
+from __future__ import annotations
+import copy
+import inspect
+from pathlib import Path
+from typing import Iterable, Type
+from kupydo.internal.base import *
+from kupydo.internal.types import ObjectKey
+from kupydo.internal.project_config import ProjectPublicConfig
+from kupydo.internal.kube_models import cluster_wide, namespaced  # noqa: registers the built-in kinds
+from kupydo.internal import errors
+from kupydo.internal import utils
+from .scheduler import Scopes, is_namespaced
+
+
+__all__ = [
+    "OWNER_LABEL",
+    "PruneScope",
+    "resolve_deployment_id",
+    "stamp_owner",
+    "owner_selector",
+    "scoped_key",
+    "listable_kinds",
+    "prune_phases"
+]
+
+
+OWNER_LABEL = "kupydo.io/deployment-id"
+PruneScope = tuple[Type[KupydoBaseModel], str | None]
+
+
+def resolve_deployment_id(heart_path: Path | None) -> str | None:
+    if heart_path is None:
+        return None
+    try:
+        config_path = utils.find_repo_path() / ".kupydo"
+    except errors.RepoNotFoundError:
+        return None
+    if not config_path.is_file() or not config_path.stat().st_size:
+        return None
+    deployment = ProjectPublicConfig().find_deployment(heart_path)
+    return deployment.id if deployment else None
+
+
+def stamp_owner(models: Iterable[KupydoBaseModel], deployment_id: str) -> list[KupydoBaseModel]:
+    stamped = list()
+    for model in models:
+        labels = model._render()["metadata"].get("labels") or dict()
+        if labels.get(OWNER_LABEL) != deployment_id:
+            values = model._values.copy()
+            values.labels = {**(values.labels or dict()), OWNER_LABEL: deployment_id}
+            manifest = model._render(values)
+            model = copy.copy(model)
+            model._manifest = manifest
+        stamped.append(model)
+    return stamped
+
+
+def owner_selector(deployment_id: str) -> str:
+    return f"{OWNER_LABEL}={deployment_id}"
+
+
+def scoped_key(model: KupydoBaseModel, scopes: Scopes) -> ObjectKey:
+    if is_namespaced(model, scopes):
+        return model._key
+    return model._key._replace(namespace=None)
+
+
+def listable_kinds() -> list[Type[KupydoBaseModel]]:
+    found: dict[tuple[str, str], Type[KupydoBaseModel]] = dict()
+    pending = [KupydoBaseModel]
+    while pending:
+        model_cls = pending.pop(0)
+        pending.extend(model_cls.__subclasses__())
+        if inspect.isabstract(model_cls) or not hasattr(model_cls, "_kind"):
+            continue
+        found.setdefault((model_cls._api_version, model_cls._kind), model_cls)
+    return list(found.values())
+
+
+def prune_phases(models: Iterable[KupydoBaseModel],
+                 kinds: Iterable[Type[KupydoBaseModel]] = None
+                 ) -> list[list[PruneScope]]:
+    models = list(models)
+    kinds = listable_kinds() if kinds is None else list(kinds)
+    by_kind: dict[tuple[str, str], Type[KupydoBaseModel]] = dict()
+    for model_cls in [type(m) for m in models] + kinds:
+        by_kind.setdefault((model_cls._api_version, model_cls._kind), model_cls)
+
+    namespaces = sorted({
+        m._values.namespace for m in models
+        if isinstance(m, KupydoNamespacedModel)
+    })
+    namespaced, cluster_wide = list(), list()
+    for model_cls in by_kind.values():
+        if issubclass(model_cls, KupydoNamespacedModel):
+            namespaced.extend((model_cls, ns) for ns in namespaces)
+        elif issubclass(model_cls, KupydoClusterWideModel):
+            cluster_wide.append((model_cls, None))
+        else:
+            namespaced.append((model_cls, None))
+    return [namespaced, cluster_wide]
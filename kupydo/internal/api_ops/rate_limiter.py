@@ -0,0 +1,49 @@
+#
+#   MIT License
+#
+#   Copyright (c) 2023, Mattias Aabmets
+#
+#   The contents of this file are subject to the terms and conditions defined in the License.
+#   You may not use, modify, or distribute this file except in compliance with the License.
+#
+#   SPDX-License-Identifier: MIT
+#
+import time
+import asyncio
+import functools
+from kupydo.internal.types import AsyncCallable
+
+
+__all__ = ["TokenBucket"]
+
+
+class TokenBucket:
+    def __init__(self, qps: float, burst: int = None) -> None:
+        if qps <= 0:
+            raise ValueError("qps must be a positive number")
+        self._qps = float(qps)
+        self._burst = burst or max(1, int(qps))
+        self._tokens = float(self._burst)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._updated
+        self._tokens = min(self._burst, self._tokens + elapsed * self._qps)
+        self._updated = now
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            self._refill()
+            if self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self._qps)
+                self._refill()
+            self._tokens -= 1
+
+    def wrap(self, func: AsyncCallable) -> AsyncCallable:
+        @functools.wraps(func)
+        async def closure(*args, **kwargs):
+            await self.acquire()
+            return await func(*args, **kwargs)
+        return closure
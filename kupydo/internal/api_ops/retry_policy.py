@@ -0,0 +1,117 @@
+#
+#   MIT License
+#
+#   Copyright (c) 2023, Mattias Aabmets
+#
+#   The contents of this file are subject to the terms and conditions defined in the License.
+#   You may not use, modify, or distribute this file except in compliance with the License.
+#
+#   SPDX-License-Identifier: MIT
+#
+from __future__ import annotations
+import time
+import random
+import asyncio
+import functools
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Iterator
+from aiohttp import ClientConnectionError, ClientConnectorError
+from kubernetes_asyncio.client import ApiException
+from kubernetes_asyncio.client.rest import RESTResponse
+from kupydo.internal.types import AsyncCallable
+
+
+__all__ = ["RetryBudget", "RetryPolicy"]
+
+
+_UNPROCESSED_STATUSES = frozenset({429})
+_current_budget: ContextVar[RetryBudget | None] = ContextVar("retry_budget", default=None)
+
+
+class RetryBudget:
+    def __init__(self, retries: int) -> None:
+        self.remaining = retries
+
+    def consume(self) -> bool:
+        if self.remaining <= 0:
+            return False
+        self.remaining -= 1
+        return True
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    max_attempts: int = 5
+    base_delay: float = 0.2
+    max_delay: float = 10.0
+    deadline: float | None = 60.0
+    batch_retries: int | None = 100
+    statuses: frozenset[int] = field(default=frozenset({429, 500, 503, 504}))
+
+    def backoff(self, attempt: int) -> float:
+        ceiling = min(self.max_delay, self.base_delay * 2 ** attempt)
+        return random.uniform(0, ceiling)
+
+    @staticmethod
+    def retry_after(error: ApiException) -> float | None:
+        value = (error.headers or {}).get("Retry-After")
+        try:
+            return max(0.0, float(value))
+        except (TypeError, ValueError):
+            return None
+
+    def is_retryable(self, error: Exception, idempotent: bool = True) -> bool:
+        if isinstance(error, ApiException):
+            return error.status in self._statuses(idempotent)
+        if not idempotent:
+            return isinstance(error, ClientConnectorError)
+        return isinstance(error, (ClientConnectionError, ConnectionResetError))
+
+    def _statuses(self, idempotent: bool) -> frozenset[int]:
+        return self.statuses if idempotent else self.statuses & _UNPROCESSED_STATUSES
+
+    @contextmanager
+    def batch(self) -> Iterator[RetryBudget | None]:
+        budget = None
+        if self.batch_retries is not None:
+            budget = RetryBudget(self.batch_retries)
+        token = _current_budget.set(budget)
+        try:
+            yield budget
+        finally:
+            _current_budget.reset(token)
+
+    async def _check_raw_status(self, response, idempotent: bool) -> None:
+        if response.status in self._statuses(idempotent):
+            async with response:
+                data = await response.read()
+            raise ApiException(http_resp=RESTResponse(response, data))
+
+    def wrap(self, func: AsyncCallable, idempotent: bool = True) -> AsyncCallable:
+        @functools.wraps(func)
+        async def closure(*args, **kwargs):
+            started = time.monotonic()
+            attempt = 0
+            while True:
+                try:
+                    result = await func(*args, **kwargs)
+                    if kwargs.get("_preload_content") is False:
+                        await self._check_raw_status(result, idempotent)
+                    return result
+                except Exception as error:
+                    attempt += 1
+                    if not self.is_retryable(error, idempotent) or attempt >= self.max_attempts:
+                        raise
+                    delay = self.backoff(attempt)
+                    if isinstance(error, ApiException):
+                        delay = self.retry_after(error) or delay
+                    if self.deadline is not None:
+                        if time.monotonic() - started + delay > self.deadline:
+                            raise
+                    budget = _current_budget.get()
+                    if budget is not None and not budget.consume():
+                        raise
+                    await asyncio.sleep(delay)
+        return closure
@@ -0,0 +1,61 @@
+#
+#   MIT License
+#
+#   Copyright (c) 2023, Mattias Aabmets
+#
+#   The contents of this file are subject to the terms and conditions defined in the License.
+#   You may not use, modify, or distribute this file except in compliance with the License.
+#
+#   SPDX-License-Identifier: MIT
+#
+from __future__ import annotations
+from typing import NamedTuple, Iterable
+from kupydo.internal.types import *
+from kupydo.internal import errors
+from .waiter import wait_for_keys
+
+
+__all__ = ["RolloutStatus", "rollout_status", "wait_rollouts"]
+
+
+class RolloutStatus(NamedTuple):
+    complete: bool
+    failed: bool
+    message: str
+
+
+def rollout_status(obj: RawDict) -> RolloutStatus:
+    metadata = obj.get("metadata") or dict()
+    spec = obj.get("spec") or dict()
+    status = obj.get("status") or dict()
+
+    if metadata.get("generation", 0) > status.get("observedGeneration", -1):
+        return RolloutStatus(False, False, "waiting for the spec update to be observed")
+    for condition in status.get("conditions") or list():
+        if condition.get("type") == "Progressing" and condition.get("reason") == "ProgressDeadlineExceeded":
+            return RolloutStatus(False, True, condition.get("message", "progress deadline exceeded"))
+
+    desired = spec.get("replicas", 1)
+    updated = status.get("updatedReplicas", 0)
+    if updated < desired:
+        return RolloutStatus(False, False, f"{updated} of {desired} new replicas have been updated")
+    if (total := status.get("replicas", 0)) > updated:
+        return RolloutStatus(False, False, f"{total - updated} old replicas are pending termination")
+    if (available := status.get("availableReplicas", 0)) < updated:
+        return RolloutStatus(False, False, f"{available} of {updated} updated replicas are available")
+    return RolloutStatus(True, False, "successfully rolled out")
+
+
+async def wait_rollouts(list_func: AsyncCallable, keys: Iterable[ObjectKey], timeout: float = None) -> None:
+    def condition(event_type: str, obj: RawDict | None) -> bool:
+        if event_type == "ABSENT":
+            return False
+        key = ObjectKey(obj.get("kind", "Deployment"), obj["metadata"].get("namespace"), obj["metadata"]["name"])
+        if event_type == "DELETED":
+            raise errors.RolloutFailedError(key, "object was deleted")
+        state = rollout_status(obj)
+        if state.failed:
+            raise errors.RolloutFailedError(key, state.message)
+        return state.complete
+
+    await wait_for_keys(list_func, keys, condition, errors.RolloutTimeoutError, timeout)
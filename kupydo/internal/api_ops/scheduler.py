@@ -0,0 +1,110 @@
+#
+#   MIT License
+#
+#   Copyright (c) 2023, Mattias Aabmets
+#
+#   The contents of this file are subject to the terms and conditions defined in the License.
+#   You may not use, modify, or distribute this file except in compliance with the License.
+#
+#   SPDX-License-Identifier: MIT
+#
+from __future__ import annotations
+import asyncio
+from typing import Callable, Coroutine, Iterable, Any
+from kupydo.internal.response import Response, ErrorDetails
+from kupydo.internal.base import *
+from kupydo.internal.types import *
+from kupydo.internal import errors
+
+
+__all__ = ["Scopes", "is_namespaced", "DependencyScheduler"]
+
+
+Operation = Callable[[KupydoBaseModel], Coroutine[Any, Any, Response]]
+Scopes = dict[tuple[str, str], bool]
+
+
+def is_namespaced(model: KupydoBaseModel, scopes: Scopes) -> bool:
+    if isinstance(model, KupydoNamespacedModel):
+        return True
+    if isinstance(model, KupydoClusterWideModel):
+        return False
+    return scopes.get((model._api_version, model._kind), "namespace" in model._namespace)
+
+
+class DependencyScheduler:
+    def __init__(self, models: Iterable[KupydoBaseModel], scopes: Scopes = None) -> None:
+        self._models = list(models)
+        self._depends = self._build_graph(self._models, scopes or dict())
+
+    @classmethod
+    def _build_graph(cls, models: list[KupydoBaseModel], scopes: Scopes) -> list[set[int]]:
+        index: dict[ObjectKey, list[int]] = dict()
+        for i, model in enumerate(models):
+            index.setdefault(model._key, list()).append(i)
+
+        depends = [set() for _ in models]
+        for i, model in enumerate(models):
+            refs = list(model._references)
+            namespace = model._namespace.get("namespace")
+            if namespace and is_namespaced(model, scopes):
+                refs.append(ObjectKey("Namespace", None, namespace))
+            for ref in refs:
+                depends[i].update(j for j in index.get(ref, []) if j != i)
+        return depends
+
+    @property
+    def waves(self) -> list[list[KupydoBaseModel]]:
+        levels: list[int | None] = [None] * len(self._models)
+        remaining = set(range(len(self._models)))
+        level = 0
+        while remaining:
+            ready = {
+                i for i in remaining
+                if all(levels[j] is not None for j in self._depends[i])
+            }
+            if not ready:
+                keys = [self._models[i]._key for i in sorted(remaining)]
+                raise errors.DependencyCycleError(keys)
+            for i in ready:
+                levels[i] = level
+            remaining -= ready
+            level += 1
+        waves = [list() for _ in range(level)]
+        for i, lvl in enumerate(levels):
+            waves[lvl].append(self._models[i])
+        return waves
+
+    async def run(self, operation: Operation, concurrency: int) -> list[Response]:
+        _ = self.waves  # fail fast on dependency cycles
+        semaphore = asyncio.Semaphore(concurrency)
+        loop = asyncio.get_running_loop()
+        futures = [loop.create_future() for _ in self._models]
+
+        async def execute(i: int) -> Response:
+            try:
+                for j in self._depends[i]:
+                    dependency: Response = await asyncio.shield(futures[j])
+                    if dependency.error is not None:
+                        key = self._models[j]._key
+                        response = Response(code=424, error=ErrorDetails(
+                            status="KupydoError",
+                            reason="DependencyFailed",
+                            message=f"Dependency '{key.kind}/{key.name}' failed to apply."
+                        ))
+                        break
+                else:
+                    async with semaphore:
+                        response = await operation(self._models[i])
+                futures[i].set_result(response)
+                return response
+            except asyncio.CancelledError:
+                futures[i].cancel()
+                raise
+            except Exception as ex:
+                futures[i].set_exception(ex)
+                raise
+
+        return list(await asyncio.gather(*[
+            execute(i) for i in range(len(self._models))
+        ]))
@@ -0,0 +1,94 @@
+#
+#   MIT License
+#
+#   Copyright (c) 2023, Mattias Aabmets
+#
+#   The contents of this file are subject to the terms and conditions defined in the License.
+#   You may not use, modify, or distribute this file except in compliance with the License.
+#
+#   SPDX-License-Identifier: MIT
+#
+from __future__ import annotations
+import asyncio
+from typing import Callable, Coroutine, Hashable, Any
+from dataclasses import dataclass
+from kubernetes_asyncio import client
+
+
+__all__ = ["SessionPool"]
+
+
+SessionFactory = Callable[[], Coroutine[Any, Any, client.ApiClient]]
+
+
+@dataclass
+class _PoolEntry:
+    loop: asyncio.AbstractEventLoop
+    task: asyncio.Task[client.ApiClient]
+    refs: int = 0
+    idle_handle: asyncio.TimerHandle | None = None
+
+    async def close(self) -> None:
+        if self.idle_handle is not None:
+            self.idle_handle.cancel()
+        if not self.task.done():
+            self.task.cancel()
+        elif not self.task.cancelled() and self.task.exception() is None:
+            await self.task.result().close()
+
+
+class SessionPool:
+    idle_timeout: float = 30.0
+    _entries: dict[Hashable, _PoolEntry] = dict()
+    _closing: set[asyncio.Task] = set()
+
+    @classmethod
+    async def acquire(cls, key: Hashable, factory: SessionFactory) -> client.ApiClient:
+        loop = asyncio.get_running_loop()
+        entry = cls._entries.get(key)
+        if entry is None or entry.loop is not loop:
+            entry = _PoolEntry(loop=loop, task=loop.create_task(factory()))
+            cls._entries[key] = entry
+        if entry.idle_handle is not None:
+            entry.idle_handle.cancel()
+            entry.idle_handle = None
+        entry.refs += 1
+        try:
+            return await asyncio.shield(entry.task)
+        except BaseException:
+            entry.refs -= 1
+            if entry.task.done() and cls._entries.get(key) is entry:
+                del cls._entries[key]
+            raise
+
+    @classmethod
+    def release(cls, key: Hashable) -> None:
+        if entry := cls._entries.get(key):
+            entry.refs = max(0, entry.refs - 1)
+            if entry.refs == 0 and entry.idle_handle is None:
+                entry.idle_handle = entry.loop.call_later(cls.idle_timeout, cls._expire, key, entry)
+
+    @classmethod
+    def _expire(cls, key: Hashable, entry: _PoolEntry) -> None:
+        entry.idle_handle = None
+        if entry.refs or cls._entries.get(key) is not entry:
+            return
+        del cls._entries[key]
+        task = entry.loop.create_task(entry.close())
+        cls._closing.add(task)
+        task.add_done_callback(cls._closing.discard)
+
+    @classmethod
+    def borrowed(cls, key: Hashable) -> int:
+        entry = cls._entries.get(key)
+        return entry.refs if entry else 0
+
+    @classmethod
+    async def shutdown_all(cls) -> None:
+        loop = asyncio.get_running_loop()
+        entries, cls._entries = cls._entries, dict()
+        for entry in entries.values():
+            if entry.loop is loop:
+                await entry.close()
+        closing = [task for task in cls._closing if task.get_loop() is loop]
+        await asyncio.gather(*closing, return_exceptions=True)
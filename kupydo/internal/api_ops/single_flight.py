@@ -0,0 +1,40 @@
+#
+#   MIT License
+#
+#   Copyright (c) 2023, Mattias Aabmets
+#
+#   The contents of this file are subject to the terms and conditions defined in the License.
+#   You may not use, modify, or distribute this file except in compliance with the License.
+#
+#   SPDX-License-Identifier: MIT
+#
+from __future__ import annotations
+import asyncio
+from typing import Callable, Coroutine, Hashable, TypeVar, Any
+
+
+__all__ = ["SingleFlight"]
+
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    def __init__(self) -> None:
+        self._calls: dict[Hashable, asyncio.Task] = dict()
+
+    async def do(self, key: Hashable, func: Callable[[], Coroutine[Any, Any, T]]) -> T:
+        task = self._calls.get(key)
+        if task is None:
+            # The shared task copies the first caller's context, so retries made
+            # on behalf of every waiter draw from that caller's RetryBudget.
+            task = asyncio.ensure_future(func())
+            self._calls[key] = task
+            task.add_done_callback(lambda _: self._forget(key, task))
+        return await asyncio.shield(task)
+
+    def _forget(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        if not task.cancelled():
+            task.exception()
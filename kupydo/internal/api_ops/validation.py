@@ -0,0 +1,52 @@
+#
+#   MIT License
+#
+#   Copyright (c) 2023, Mattias Aabmets
+#
+#   The contents of this file are subject to the terms and conditions defined in the License.
+#   You may not use, modify, or distribute this file except in compliance with the License.
+#
+#   SPDX-License-Identifier: MIT
+#
+from __future__ import annotations
+from dataclasses import dataclass, field
+from kupydo.internal.response import Response
+from kupydo.internal.base import *
+from kupydo.internal.types import *
+
+
+__all__ = ["ValidationReport"]
+
+
+@dataclass
+class ValidationReport:
+    results: dict[ObjectKey, Response] = field(default_factory=dict)
+    pending_namespaces: set[str] = field(default_factory=set)
+
+    def add(self, key: ObjectKey, response: Response) -> None:
+        self.results[key] = response
+
+    def _is_deferred(self, key: ObjectKey, response: Response) -> bool:
+        error = response.error
+        if error is None or response.code != 404 or key.namespace not in self.pending_namespaces:
+            return False
+        return (error.details or dict()).get("kind") == "namespaces"
+
+    @property
+    def passed(self) -> list[ObjectKey]:
+        return [k for k, r in self.results.items() if r.error is None]
+
+    @property
+    def deferred(self) -> list[ObjectKey]:
+        return [k for k, r in self.results.items() if self._is_deferred(k, r)]
+
+    @property
+    def failed(self) -> dict[ObjectKey, Response]:
+        return {
+            k: r for k, r in self.results.items()
+            if r.error is not None and not self._is_deferred(k, r)
+        }
+
+    @property
+    def ok(self) -> bool:
+        return not self.failed
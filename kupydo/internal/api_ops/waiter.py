@@ -0,0 +1,84 @@
+#
+#   MIT License
+#
+#   Copyright (c) 2023, Mattias Aabmets
+#
+#   The contents of this file are subject to the terms and conditions defined in the License.
+#   You may not use, modify, or distribute this file except in compliance with the License.
+#
+#   SPDX-License-Identifier: MIT
+#
+from __future__ import annotations
+import asyncio
+from typing import Callable, Iterable
+from kupydo.internal.types import *
+from .pager import list_resource
+from .watcher import watch_resource
+
+
+__all__ = ["Condition", "wait_for_keys"]
+
+
+Condition = Callable[[str, RawDict | None], bool]
+TimeoutFactory = Callable[[list[ObjectKey]], Exception]
+
+
+async def _wait_in_scope(list_func: AsyncCallable,
+                         namespace: str | None,
+                         pending: set[str],
+                         condition: Condition) -> None:
+    kwargs = dict(namespace=namespace) if namespace else dict()
+    if len(pending) == 1:
+        kwargs.update(field_selector=f"metadata.name={next(iter(pending))}")
+
+    items, resource_version = await list_resource(list_func, **kwargs)
+    present = {item["metadata"]["name"]: item for item in items}
+    for name in list(pending):
+        obj = present.get(name)
+        if condition("ADDED" if obj else "ABSENT", obj):
+            pending.discard(name)
+    if not pending:
+        return
+
+    events = watch_resource(list_func, resource_version, **kwargs)
+    try:
+        async for event in events:
+            name = event.object.get("metadata", dict()).get("name")
+            if name in pending and condition(event.type, event.object):
+                pending.discard(name)
+                if not pending:
+                    return
+    finally:
+        await events.aclose()
+
+
+async def wait_for_keys(list_func: AsyncCallable,
+                        keys: Iterable[ObjectKey],
+                        condition: Condition,
+                        on_timeout: TimeoutFactory,
+                        timeout: float = None) -> None:
+    pending: dict[str | None, set[str]] = dict()
+    kind = None
+    for key in keys:
+        pending.setdefault(key.namespace, set()).add(key.name)
+        kind = key.kind
+    tasks = [
+        asyncio.create_task(_wait_in_scope(list_func, ns, names, condition))
+        for ns, names in pending.items()
+    ]
+    if not tasks:
+        return
+    try:
+        done, _ = await asyncio.wait(tasks, timeout=timeout, return_when=asyncio.FIRST_EXCEPTION)
+        for task in done:
+            task.result()
+        if len(done) < len(tasks):
+            raise on_timeout([
+                ObjectKey(kind, ns, name)
+                for ns, names in pending.items()
+                for name in sorted(names)
+            ])
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
@@ -0,0 +1,108 @@
+#
+#   MIT License
+#
+#   Copyright (c) 2023, Mattias Aabmets
+#
+#   The contents of this file are subject to the terms and conditions defined in the License.
+#   You may not use, modify, or distribute this file except in compliance with the License.
+#
+#   SPDX-License-Identifier: MIT
+#
+import orjson
+import asyncio
+from typing import AsyncIterator, Generic
+from dataclasses import dataclass
+from aiohttp import ClientError
+from kubernetes_asyncio.client import ApiException
+from kubernetes_asyncio.client.rest import RESTResponse
+from kupydo.internal.types import AsyncCallable, RawDict, RawModel
+from .pager import list_resource
+
+
+__all__ = [
+    "WatchEvent",
+    "stream_watch_events",
+    "watch_resource"
+]
+
+
+@dataclass(frozen=True)
+class WatchEvent(Generic[RawModel]):
+    type: str
+    object: RawModel
+    resource_version: str | None
+
+
+def _object_key(obj: RawDict) -> tuple[str | None, str]:
+    metadata = obj.get("metadata", dict())
+    return metadata.get("namespace"), metadata.get("name")
+
+
+async def stream_watch_events(list_func: AsyncCallable,
+                              resource_version: str = None,
+                              timeout_seconds: int = None,
+                              **kwargs) -> AsyncIterator[RawDict]:
+    response = await list_func(
+        watch=True,
+        allow_watch_bookmarks=True,
+        resource_version=resource_version,
+        timeout_seconds=timeout_seconds,
+        _preload_content=False,
+        **kwargs
+    )
+    async with response:
+        if not 200 <= response.status <= 299:
+            data = await response.read()
+            raise ApiException(http_resp=RESTResponse(response, data))
+        async for line in response.content:
+            if line.strip():
+                yield orjson.loads(line)
+
+
+async def watch_resource(list_func: AsyncCallable,
+                         resource_version: str = None,
+                         retry_delay: float = 1.0,
+                         **kwargs) -> AsyncIterator[WatchEvent]:
+    seen: dict[tuple[str | None, str], str] = dict()
+    relist = False
+    while True:
+        if relist:
+            items, resource_version = await list_resource(list_func, **kwargs)
+            current = {_object_key(item): item for item in items}
+            for key in set(seen) - set(current):
+                rv = seen.pop(key)
+                namespace, name = key
+                metadata = dict(name=name, namespace=namespace, resourceVersion=rv)
+                yield WatchEvent("DELETED", dict(metadata=metadata), rv)
+            for key, item in current.items():
+                rv = item["metadata"].get("resourceVersion")
+                if key not in seen:
+                    seen[key] = rv
+                    yield WatchEvent("ADDED", item, rv)
+                elif seen[key] != rv:
+                    seen[key] = rv
+                    yield WatchEvent("MODIFIED", item, rv)
+            relist = False
+        try:
+            async for event in stream_watch_events(list_func, resource_version, **kwargs):
+                obj = event.get("object", dict())
+                if event.get("type") == "ERROR":
+                    if obj.get("code") != 410:
+                        raise ApiException(status=obj.get("code"), reason=obj.get("reason"))
+                    relist = True
+                    break
+                metadata = obj.get("metadata", dict())
+                resource_version = metadata.get("resourceVersion") or resource_version
+                if event["type"] == "BOOKMARK":
+                    continue
+                if event["type"] == "DELETED":
+                    seen.pop(_object_key(obj), None)
+                else:
+                    seen[_object_key(obj)] = resource_version
+                yield WatchEvent(event["type"], obj, resource_version)
+        except ApiException as ex:
+            if ex.status != 410:
+                raise
+            relist = True
+        except (ClientError, asyncio.TimeoutError):
+            await asyncio.sleep(retry_delay)
@@ -9,19 +9,22 @@
 #   SPDX-License-Identifier: MIT
 #
 from __future__ import annotations
+import orjson
 from kubernetes_asyncio import client
+from kubernetes_asyncio.client.rest import RESTResponse
 from dataclasses import dataclass
 from pydantic import BaseModel
 from typing import Type, Any
 from abc import ABC, abstractmethod
 from dotmap import DotMap
 from kupydo.internal import utils
-from .registry import GlobalRegistry
+from .registry import GlobalRegistry, DynamicTypeRegistry
 from .errors import DisabledRegistryError
 from .types import *
 
 
 __all__ = [
+    "CONTENT_HASH_ANNOTATION",
     "KupydoApiActions",
     "KupydoBaseValues",
     "KupydoBaseModel",
@@ -30,6 +33,9 @@ __all__ = [
 ]
 
 
+CONTENT_HASH_ANNOTATION = "kupydo.io/content-hash"
+
+
 @dataclass
 class KupydoApiActions:
     create: AsyncCallable
@@ -37,6 +43,10 @@ class KupydoApiActions:
     read: AsyncCallable
     replace: AsyncCallable
     patch: AsyncCallable
+    list: AsyncCallable
+    read_metadata: AsyncCallable = None
+    list_metadata: AsyncCallable = None
+    list_all: AsyncCallable = None
 
 
 class KupydoBaseValues(BaseModel):
@@ -47,7 +57,12 @@ class KupydoBaseValues(BaseModel):
 
 
 class KupydoBaseModel(ABC):
+    _api_group: ApiType
+    _api_version: str
+    _kind: str
+    _plural: str
     _values = DotMap()
+    _manifest: dict | None = None
 
     @abstractmethod
     def __init__(self,
@@ -78,45 +93,199 @@ class KupydoBaseModel(ABC):
             return dict(namespace=self._values.namespace)
         return dict()
 
+    @property
+    def _key(self) -> ObjectKey:
+        return ObjectKey(
+            kind=self._kind,
+            namespace=self._namespace.get("namespace"),
+            name=self._values.name
+        )
+
+    @classmethod
+    def _raw_type(cls) -> str:
+        version = cls._api_version.split("/")[-1]
+        return version.capitalize() + cls._kind
+
+    @classmethod
+    def _parse_values(cls, obj: dict) -> dict:
+        meta = obj.get("metadata", dict())
+        return dict(
+            name=meta.get("name"),
+            namespace=meta.get("namespace"),
+            annotations=meta.get("annotations"),
+            labels=meta.get("labels")
+        )
+
+    @classmethod
+    def _from_dict(cls, obj: dict) -> KupydoBaseModel:
+        values = DotMap(cls._parse_values(obj), _prevent_method_masking=True)
+        return DynamicTypeRegistry.get(cls)(values)
+
+    @classmethod
+    def _resource_path(cls, namespace: str = None) -> str:
+        prefix = "/apis" if "/" in cls._api_version else "/api"
+        scope = f"/namespaces/{namespace}" if namespace else ""
+        return f"{prefix}/{cls._api_version}{scope}/{cls._plural}"
+
+    @classmethod
+    def _is_ready(cls, obj: RawDict) -> bool:
+        return True
+
+    @property
+    def _references(self) -> list[ObjectKey]:
+        return list()
+
+    def _metadata(self, v: KupydoBaseValues) -> dict:
+        return utils.compact_dict(
+            name=v.name,
+            **self._namespace,
+            annotations=v.annotations,
+            labels=v.labels
+        )
+
     @abstractmethod
     def _to_dict(self, new_values: DotMap = None) -> dict: ...
 
+    def _render(self, new_values: DotMap = None) -> dict:
+        if new_values is None and self._manifest is not None:
+            return self._manifest
+        manifest = self._to_dict(new_values)
+        metadata = manifest["metadata"]
+        metadata["annotations"] = {
+            **(metadata.get("annotations") or dict()),
+            CONTENT_HASH_ANNOTATION: utils.manifest_hash(manifest)
+        }
+        return manifest
+
+    @property
+    def content_hash(self) -> str:
+        return self._render()["metadata"]["annotations"][CONTENT_HASH_ANNOTATION]
+
+    def _freeze(self) -> None:
+        self._manifest = self._render()
+
+    @classmethod
     @abstractmethod
-    def _api(self, session: client.ApiClient) -> KupydoApiActions: ...
+    def _api(cls, api: Any) -> KupydoApiActions: ...
 
-    async def create(self, session: client.ApiClient) -> RawModel:
-        return await self._api(session).create(
-            body=self._to_dict(),
+    @staticmethod
+    async def _invoke(action: AsyncCallable, raw: bool, **kwargs) -> RawModel:
+        if not raw:
+            return await action(**kwargs)
+        response = await action(**kwargs, _preload_content=False)
+        async with response:
+            data = await response.read()
+        if not 200 <= response.status <= 299:
+            raise client.ApiException(http_resp=RESTResponse(response, data))
+        return orjson.loads(data)
+
+    async def create(self, api: KupydoApiActions, raw: bool = False) -> RawModel:
+        return await self._invoke(
+            api.create, raw,
+            body=self._render(),
+            **self._namespace
+        )
+
+    async def delete(self, api: KupydoApiActions, raw: bool = False) -> RawModel:
+        return await self._invoke(
+            api.delete, raw,
+            name=self._values.name,
             **self._namespace
         )
 
-    async def delete(self, session: client.ApiClient) -> RawModel:
-        return await self._api(session).delete(
+    async def read(self, api: KupydoApiActions, raw: bool = False) -> RawModel:
+        return await self._invoke(
+            api.read, raw,
             name=self._values.name,
             **self._namespace
         )
 
-    async def read(self, session: client.ApiClient) -> RawModel:
-        return await self._api(session).read(
+    async def apply(self,
+                    api: KupydoApiActions,
+                    field_manager: str = "kupydo",
+                    force: bool = True,
+                    raw: bool = False,
+                    dry_run: str = None
+                    ) -> RawModel:
+        return await self._invoke(
+            api.patch, raw,
             name=self._values.name,
+            body=self._render(),
+            field_manager=field_manager,
+            force=force,
+            _content_type="application/apply-patch+yaml",
+            **utils.compact_dict(dry_run=dry_run),
             **self._namespace
         )
 
-    async def replace(self, session: client.ApiClient, values_from: KupydoBaseModel) -> RawModel:
+    async def upsert(self,
+                     api: KupydoApiActions,
+                     max_attempts: int = 3,
+                     raw: bool = False
+                     ) -> RawModel:
+        try:
+            return await self._invoke(
+                api.create, raw,
+                body=self._render(),
+                **self._namespace
+            )
+        except client.ApiException as ex:
+            if ex.status != 409:
+                raise
+        for attempt in range(1, max_attempts + 1):
+            current = await self._invoke(
+                api.read, True,
+                name=self._values.name,
+                **self._namespace
+            )
+            manifest = self._render()
+            body = dict(manifest, metadata=dict(
+                manifest["metadata"],
+                resourceVersion=current["metadata"]["resourceVersion"]
+            ))
+            try:
+                return await self._invoke(
+                    api.replace, raw,
+                    name=self._values.name,
+                    body=body,
+                    **self._namespace
+                )
+            except client.ApiException as ex:
+                if ex.status != 409 or attempt == max_attempts:
+                    raise
+
+    async def replace(self,
+                      api: KupydoApiActions,
+                      values_from: KupydoBaseModel,
+                      raw: bool = False
+                      ) -> RawModel:
         merged = utils.deep_merge(self._values, values_from.values, self._exclude, method='replace')
-        response = await self._api(session).replace(
+        self._manifest = None
+        response = await self._invoke(
+            api.replace, raw,
             name=self._values.name,
-            body=self._to_dict(merged),
+            body=self._render(merged),
             **self._namespace
         )
         self._values = merged
         return response
 
-    async def patch(self, session: client.ApiClient, values_from: KupydoBaseModel) -> RawModel:
+    async def patch(self,
+                    api: KupydoApiActions,
+                    values_from: KupydoBaseModel,
+                    raw: bool = False
+                    ) -> RawModel:
+        current = utils.to_plain_dict(self._render())
         merged = utils.deep_merge(self._values, values_from.values, self._exclude, method='patch')
-        response = await self._api(session).patch(
+        self._manifest = None
+        changes = utils.merge_patch(current, utils.to_plain_dict(self._render(merged)))
+        if not changes:
+            return await self.read(api, raw)
+        response = await self._invoke(
+            api.patch, raw,
             name=self._values.name,
-            body=self._to_dict(merged),
+            body=changes,
+            _content_type="application/merge-patch+json",
             **self._namespace
         )
         self._values = merged
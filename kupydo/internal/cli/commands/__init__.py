@@ -8,6 +8,7 @@
 #
 #   SPDX-License-Identifier: MIT
 #
+from .apply import apply_app
 from .decrypt import dec_app
 from .encrypt import enc_app
 from .init import init_app
@@ -15,6 +16,7 @@ from .update import update_app
 
 
 __all__ = [
+	"apply_app",
 	"dec_app",
 	"enc_app",
 	"init_app",
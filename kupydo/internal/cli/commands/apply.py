@@ -0,0 +1,105 @@
+#
+#   MIT License
+#
+#   Copyright (c) 2023, Mattias Aabmets
+#
+#   The contents of this file are subject to the terms and conditions defined in the License.
+#   You may not use, modify, or distribute this file except in compliance with the License.
+#
+#   SPDX-License-Identifier: MIT
+#
+import asyncio
+from pathlib import Path
+from typing import Annotated, Optional
+from typer import Typer, Option, Argument, Exit
+from rich.console import Console
+from rich.table import Table
+from kupydo.internal.registry import GlobalRegistry
+from kupydo.internal.fanout import *
+
+
+apply_app = Typer(name="apply")
+
+
+HeartPath = Annotated[Path, Argument(
+	exists=True, dir_okay=False, resolve_path=True,
+	help='Path to the Heart.py file of the deployment.'
+)]
+Contexts = Annotated[Optional[list[str]], Option(
+	'--context', '-c', show_default=False,
+	help='Kube context to deploy to, repeatable. Defaults to all contexts.'
+)]
+Namespace = Annotated[str, Option(
+	'--namespace', '-n',
+	help='Namespace for the namespaced resources.'
+)]
+DeploymentId = Annotated[Optional[str], Option(
+	'--deployment-id', show_default=False,
+	help='Deployment id used to label and prune owned resources. '
+		 'Defaults to the id of the Heart.py in the project config.'
+)]
+Prune = Annotated[bool, Option(
+	'--prune', show_default=False,
+	help='Delete owned resources which are no longer in Heart.py.'
+)]
+SkipUnchanged = Annotated[bool, Option(
+	'--skip-unchanged', show_default=False,
+	help='Skip resources whose content hash has not changed.'
+)]
+Concurrency = Annotated[int, Option(
+	'--concurrency',
+	help='Maximum concurrent requests per cluster.'
+)]
+Qps = Annotated[Optional[float], Option(
+	'--qps', show_default=False,
+	help='Client-side request rate limit per cluster.'
+)]
+
+
+@apply_app.callback(invoke_without_command=True)
+def cmd_apply(
+		path: HeartPath,
+		context: Contexts = None,
+		namespace: Namespace = 'default',
+		deployment_id: DeploymentId = None,
+		prune: Prune = False,
+		skip_unchanged: SkipUnchanged = False,
+		concurrency: Concurrency = 10,
+		qps: Qps = None):
+	GlobalRegistry.set_enabled(True)
+	GlobalRegistry.load_resources(path)
+	registry = GlobalRegistry(namespace=namespace)
+
+	results = asyncio.run(apply_to_contexts(
+		registry, context,
+		deployment_id=deployment_id,
+		prune=prune,
+		skip_unchanged=skip_unchanged,
+		concurrency=concurrency,
+		qps=qps
+	))
+
+	table = Table(title="Apply Results")
+	table.add_column("Resource")
+	for ctx in results:
+		table.add_column(ctx, justify="center")
+	for key, codes in result_matrix(registry, results):
+		name = f"{key.kind}/{key.namespace}/{key.name}" if key.namespace else f"{key.kind}/{key.name}"
+		cells = [_format_code(codes[ctx]) for ctx in results]
+		table.add_row(name, *cells)
+	Console().print(table)
+
+	for ctx, result in results.items():
+		if result.error is not None:
+			Console().print(f"[red]{ctx}: {result.error}")
+		elif prune:
+			Console().print(f"{ctx}: pruned {len(result.report.pruned)} resources")
+	if not all(result.ok for result in results.values()):
+		raise Exit(code=1)
+
+
+def _format_code(code: int | None) -> str:
+	if code is None:
+		return "[grey50]-"
+	color = "green" if code < 300 else "yellow" if code < 400 else "red"
+	return f"[{color}]{code}"
@@ -21,6 +21,7 @@ from kupydo.internal.cli.commands import *
 app = Typer()
 
 
+app.add_typer(apply_app)
 app.add_typer(enc_app)
 app.add_typer(dec_app)
 app.add_typer(init_app)
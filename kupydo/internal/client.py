@@ -8,45 +8,475 @@
 #
 #   SPDX-License-Identifier: MIT
 #
+from __future__ import annotations
+import orjson
+import asyncio
+from types import SimpleNamespace
+from typing import AsyncIterator, ContextManager, Callable, Iterable, Type, Any
+from contextlib import nullcontext
+from functools import partial
+from aiohttp import ClientError
 from kubernetes_asyncio import client
+from .api_ops import *
 from .response import Response, error_handler
-from .config import autoload_config
-from .base import KupydoBaseModel
-from .types import RawModel
+from .config import load_context_config, context_namespace
+from .registry import LocalRegistry
+from .base import *
+from .kube_models.namespaced.deployment import Deployment
+from .types import AsyncCallable, ObjectKey, RawDict, RawModel
+from kupydo.internal import errors
+from kupydo.internal import utils
 
 
 __all__ = ["ApiClient"]
 
 
 class ApiClient:
-    def __init__(self, *, autoconfig: bool = True) -> None:
+    def __init__(self,
+                 *,
+                 autoconfig: bool = True,
+                 context: str = None,
+                 shared: bool = False,
+                 concurrency: int = 10,
+                 field_manager: str = "kupydo",
+                 force_conflicts: bool = True,
+                 raw: bool = False,
+                 qps: float = None,
+                 burst: int = None,
+                 retry_policy: RetryPolicy | None = RetryPolicy(),
+                 pool_size: int = 100,
+                 pool_size_per_host: int = 0,
+                 keepalive_timeout: float = 15.0,
+                 dns_cache_ttl: int | None = 10
+                 ) -> None:
         self._autoconfig = autoconfig
+        self._context = context
+        self._shared = shared
+        self._concurrency = concurrency
+        self._field_manager = field_manager
+        self._force_conflicts = force_conflicts
+        self._raw = raw
+        self._limiter = TokenBucket(qps, burst) if qps else None
+        self._retry_policy = retry_policy
+        self._connection = ConnectionSettings(
+            pool_size=pool_size,
+            pool_size_per_host=pool_size_per_host,
+            keepalive_timeout=keepalive_timeout,
+            dns_cache_ttl=dns_cache_ttl
+        )
 
     async def __aenter__(self):
         if self._autoconfig:
-            await autoload_config()
-        self._client = client.ApiClient()
+            config = await load_context_config(self._context)
+            self._default_namespace = context_namespace(self._context)
+        else:
+            config = client.Configuration.get_default_copy()
+            self._default_namespace = "default"
+        if self._shared:
+            self._pool_key = (config if self._autoconfig else None, self._connection)
+            factory = partial(create_session, config, self._connection)
+            self._client = await SessionPool.acquire(self._pool_key, factory)
+        else:
+            self._client = await create_session(config, self._connection)
+        self._api_groups: dict[Type, Any] = dict()
+        self._action_tables: dict[Type[KupydoBaseModel], KupydoApiActions] = dict()
+        self._informers: dict[tuple[str, str | None], Informer] = dict()
+        self._single_flight = SingleFlight()
         return self
 
     async def __aexit__(self, *_):
-        await self._client.close()
+        await self.stop_informers()
+        if self._shared:
+            SessionPool.release(self._pool_key)
+        else:
+            await self._client.close()
+
+    @staticmethod
+    async def shutdown_all() -> None:
+        await SessionPool.shutdown_all()
+
+    def _actions(self, model: KupydoBaseModel | Type[KupydoBaseModel]) -> KupydoApiActions:
+        model_cls = model if isinstance(model, type) else type(model)
+        if model_cls not in self._action_tables:
+            group = model._api_group
+            if group is DynamicApi and group not in self._api_groups:
+                self._api_groups[group] = DynamicApi(self._client, self._default_namespace)
+            elif group not in self._api_groups:
+                self._api_groups[group] = group(self._client)
+            api = self._api_groups[group]
+            actions = model_cls._api(api)
+            if actions.read_metadata is None:
+                actions.read_metadata, actions.list_metadata = metadata_actions(self._client, model_cls)
+            if actions.list_all is None:
+                actions.list_all = list_all_action(self._client, model_cls)
+            self._action_tables[model_cls] = self._instrument(actions)
+        return self._action_tables[model_cls]
+
+    def _list_func(self, model_cls: Type[KupydoBaseModel], namespace: str | None) -> AsyncCallable:
+        actions = self._actions(model_cls)
+        if namespace is None and issubclass(model_cls, KupydoNamespacedModel):
+            return actions.list_all
+        return actions.list
+
+    def _informer_for(self, model: KupydoBaseModel) -> Informer | None:
+        for key in (model._key[:2], (model._kind, None)):
+            informer = self._informers.get(key)
+            if informer is not None and informer.synced:
+                return informer
+        return None
+
+    def _instrument(self, actions: KupydoApiActions) -> KupydoApiActions:
+        wrapped = vars(actions).copy()
+        for name, func in wrapped.items():
+            if func is None:
+                continue
+            if self._limiter is not None:
+                func = self._limiter.wrap(func)
+            if self._retry_policy is not None:
+                func = self._retry_policy.wrap(func, idempotent=name != "create")
+            wrapped[name] = func
+        return KupydoApiActions(**wrapped)
+
+    def _retry_batch(self) -> ContextManager:
+        if self._retry_policy is None:
+            return nullcontext()
+        return self._retry_policy.batch()
+
+    def _use_raw(self, raw: bool | None) -> bool:
+        return self._raw if raw is None else raw
+
+    async def create(self,
+                     model: KupydoBaseModel,
+                     *,
+                     raw: bool = None,
+                     wait: bool = False,
+                     timeout: float = None
+                     ) -> Response[RawModel]:
+        response = await self._create(model, raw=raw)
+        if wait and response.error is None:
+            await self.wait_ready(model, timeout=timeout)
+        return response
+
+    async def delete(self,
+                     model: KupydoBaseModel,
+                     *,
+                     raw: bool = None,
+                     wait: bool = False,
+                     timeout: float = None
+                     ) -> Response[RawModel]:
+        response = await self._delete(model, raw=raw)
+        if wait and response.error is None:
+            await self.wait_deleted(model, timeout=timeout)
+        return response
 
     @error_handler
-    async def create(self, model: KupydoBaseModel) -> Response[RawModel]:
-        return await model.create(self._client)
+    async def _create(self, model: KupydoBaseModel, *, raw: bool = None) -> Response[RawModel]:
+        return await model.create(self._actions(model), self._use_raw(raw))
 
     @error_handler
-    async def delete(self, model: KupydoBaseModel) -> Response[RawModel]:
-        return await model.delete(self._client)
+    async def _delete(self, model: KupydoBaseModel, *, raw: bool = None) -> Response[RawModel]:
+        return await model.delete(self._actions(model), self._use_raw(raw))
+
+    async def wait_ready(self, *models: KupydoBaseModel, timeout: float = None) -> None:
+        def condition(model_cls: Type[KupydoBaseModel]) -> Condition:
+            return lambda event, obj: event not in ("ABSENT", "DELETED") and model_cls._is_ready(obj)
+        await self._wait_for(models, condition, "ready", timeout)
+
+    async def wait_deleted(self, *models: KupydoBaseModel, timeout: float = None) -> None:
+        def condition(_: Type[KupydoBaseModel]) -> Condition:
+            return lambda event, obj: event in ("ABSENT", "DELETED")
+        await self._wait_for(models, condition, "deleted", timeout)
+
+    async def _wait_for(self,
+                        models: Iterable[KupydoBaseModel],
+                        condition: Callable[[Type[KupydoBaseModel]], Condition],
+                        state: str,
+                        timeout: float | None
+                        ) -> None:
+        groups: dict[Type[KupydoBaseModel], list[ObjectKey]] = dict()
+        for model in models:
+            groups.setdefault(type(model), list()).append(model._key)
+        on_timeout = partial(errors.WaitTimeoutError, state=state)
+        tasks = [
+            asyncio.create_task(wait_for_keys(
+                self._actions(model_cls).list, keys,
+                condition(model_cls), on_timeout, timeout
+            ))
+            for model_cls, keys in groups.items()
+        ]
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
 
     @error_handler
-    async def read(self, model: KupydoBaseModel) -> Response[RawModel]:
-        return await model.read(self._client)
+    async def read(self, model: KupydoBaseModel, *, raw: bool = None) -> Response[RawModel]:
+        if informer := self._informer_for(model):
+            return self._read_cached(informer, model, self._use_raw(raw))
+        raw = self._use_raw(raw)
+        key = ("read", model._api_version, *model._key, raw)
+        return await self._single_flight.do(key, partial(model.read, self._actions(model), raw))
 
     @error_handler
-    async def replace(self, model: KupydoBaseModel, values_from: KupydoBaseModel) -> Response[RawModel]:
-        return await model.replace(self._client, values_from)
+    async def read_metadata(self, model: KupydoBaseModel) -> Response[RawDict]:
+        return await self._read_metadata(model)
+
+    async def _read_metadata(self, model: KupydoBaseModel) -> RawDict:
+        key = ("read_metadata", model._api_version, *model._key)
+        return await self._single_flight.do(key, partial(
+            model._invoke,
+            self._actions(model).read_metadata, True,
+            name=model._values.name,
+            **model._namespace
+        ))
+
+    def _read_cached(self, informer: Informer, model: KupydoBaseModel, raw: bool) -> RawModel:
+        obj = informer.get(model._values.name, model._key.namespace)
+        if obj is None:
+            error = client.ApiException(status=404, reason="Not Found")
+            error.body = orjson.dumps(dict(
+                status="Failure",
+                reason="NotFound",
+                message=f"{model._kind} \"{model._values.name}\" not found in informer cache"
+            ))
+            raise error
+        return obj if raw else self._deserialize(obj, model)
+
+    def _deserialize(self, obj: dict, model: KupydoBaseModel | Type[KupydoBaseModel]) -> RawModel:
+        data = SimpleNamespace(data=orjson.dumps(obj))
+        return self._client.deserialize(data, model._raw_type())
+
+    async def list(self,
+                   model_cls: Type[KupydoBaseModel],
+                   *,
+                   namespace: str = None,
+                   label_selector: str = None,
+                   field_selector: str = None,
+                   page_size: int = 500,
+                   raw: bool = None
+                   ) -> AsyncIterator[KupydoBaseModel | RawDict]:
+        raw = self._use_raw(raw)
+        list_func = self._list_func(model_cls, namespace)
+        async for item in self._paginate(list_func, model_cls, namespace, label_selector, field_selector, page_size):
+            yield item if raw else model_cls._from_dict(item)
+
+    async def list_metadata(self,
+                            model_cls: Type[KupydoBaseModel],
+                            *,
+                            namespace: str = None,
+                            label_selector: str = None,
+                            field_selector: str = None,
+                            page_size: int = 500
+                            ) -> AsyncIterator[RawDict]:
+        list_func = self._actions(model_cls).list_metadata
+        async for item in self._paginate(list_func, model_cls, namespace, label_selector, field_selector, page_size):
+            yield item
+
+    @staticmethod
+    async def _paginate(list_func: AsyncCallable,
+                        model_cls: Type[KupydoBaseModel],
+                        namespace: str | None,
+                        label_selector: str | None,
+                        field_selector: str | None,
+                        page_size: int
+                        ) -> AsyncIterator[RawDict]:
+        kwargs = utils.compact_dict(
+            label_selector=label_selector,
+            field_selector=field_selector
+        )
+        if namespace is not None and not issubclass(model_cls, KupydoClusterWideModel):
+            kwargs.update(namespace=namespace)
+        async for items, _ in paginate_resource(list_func, page_size, **kwargs):
+            for item in items:
+                yield item
+
+    async def watch(self,
+                    model: KupydoBaseModel | Type[KupydoBaseModel],
+                    *,
+                    namespace: str = None,
+                    label_selector: str = None,
+                    field_selector: str = None,
+                    resource_version: str = None,
+                    raw: bool = None
+                    ) -> AsyncIterator[WatchEvent[RawModel]]:
+        kwargs = utils.compact_dict(
+            label_selector=label_selector,
+            field_selector=field_selector
+        )
+        if not isinstance(model, type):
+            kwargs.update(model._namespace)
+            kwargs.update(field_selector=f"metadata.name={model._values.name}")
+        elif namespace is not None and not issubclass(model, KupydoClusterWideModel):
+            kwargs.update(namespace=namespace)
+        raw = self._use_raw(raw)
+        model_cls = model if isinstance(model, type) else type(model)
+        list_func = self._list_func(model_cls, kwargs.get("namespace"))
+        async for event in watch_resource(list_func, resource_version, **kwargs):
+            if not raw:
+                obj = self._deserialize(event.object, model)
+                event = WatchEvent(event.type, obj, event.resource_version)
+            yield event
+
+    async def start_informer(self,
+                             model_cls: Type[KupydoBaseModel],
+                             *,
+                             namespace: str = None,
+                             wait: bool = True
+                             ) -> Informer:
+        if issubclass(model_cls, KupydoClusterWideModel):
+            namespace = None
+        key = (model_cls._kind, namespace)
+        if key not in self._informers:
+            self._informers[key] = Informer(self._list_func(model_cls, namespace), namespace)
+        informer = self._informers[key]
+        await informer.start(wait)
+        return informer
+
+    async def stop_informers(self) -> None:
+        informers, self._informers = self._informers, dict()
+        for informer in informers.values():
+            await informer.stop()
+
+    @error_handler
+    async def apply(self,
+                    model: KupydoBaseModel,
+                    *,
+                    force: bool = None,
+                    raw: bool = None,
+                    dry_run: bool = False
+                    ) -> Response[RawModel]:
+        return await model.apply(
+            self._actions(model),
+            field_manager=self._field_manager,
+            force=self._force_conflicts if force is None else force,
+            raw=self._use_raw(raw),
+            dry_run="All" if dry_run else None
+        )
+
+    # Costs up to three round-trips per object (create, read, replace) when it
+    # already exists; apply() does the same server-side in a single request.
+    @error_handler
+    async def upsert(self, model: KupydoBaseModel, *, max_attempts: int = 3, raw: bool = None) -> Response[RawModel]:
+        return await model.upsert(self._actions(model), max_attempts, self._use_raw(raw))
 
     @error_handler
-    async def patch(self, model: KupydoBaseModel, values_from: KupydoBaseModel) -> Response[RawModel]:
-        return await model.patch(self._client, values_from)
+    async def replace(self, model: KupydoBaseModel, values_from: KupydoBaseModel, *, raw: bool = None) -> Response[RawModel]:
+        return await model.replace(self._actions(model), values_from, self._use_raw(raw))
+
+    @error_handler
+    async def patch(self, model: KupydoBaseModel, values_from: KupydoBaseModel, *, raw: bool = None) -> Response[RawModel]:
+        return await model.patch(self._actions(model), values_from, self._use_raw(raw))
+
+    async def sync(self, model: KupydoBaseModel, *, force: bool = None, raw: bool = None) -> Response[RawModel]:
+        try:
+            current = await self._current_hash(model)
+        except (client.ApiException, ClientError):
+            current = None
+        if current == model.content_hash:
+            return Response(code=304)
+        return await self.apply(model, force=force, raw=raw)
+
+    async def _current_hash(self, model: KupydoBaseModel) -> str | None:
+        if informer := self._informer_for(model):
+            obj = informer.get(model._values.name, model._key.namespace)
+        else:
+            try:
+                obj = await self._read_metadata(model)
+            except client.ApiException as ex:
+                if ex.status != 404:
+                    raise
+                obj = None
+        annotations = (obj or dict()).get("metadata", dict()).get("annotations") or dict()
+        return annotations.get(CONTENT_HASH_ANNOTATION)
+
+    async def apply_all(self,
+                        registry: LocalRegistry,
+                        *,
+                        deployment_id: str = None,
+                        prune: bool = False,
+                        skip_unchanged: bool = False,
+                        concurrency: int = None,
+                        raw: bool = None
+                        ) -> ApplyReport:
+        deployment_id = deployment_id or resolve_deployment_id(getattr(registry, "path", None))
+        if prune and not deployment_id:
+            raise ValueError("Pruning requires a deployment_id to select owned objects.")
+        models = stamp_owner(registry, deployment_id) if deployment_id else list(registry)
+        scheduler = DependencyScheduler(models, await self._resolve_scopes(models))
+        operation = partial(self.sync if skip_unchanged else self.apply, raw=raw)
+        report = ApplyReport()
+        with self._retry_batch():
+            responses = await scheduler.run(operation, concurrency or self._concurrency)
+            report.applied.update(zip([model._key for model in models], responses))
+            if prune:
+                report.pruned.update(await self.prune(models, deployment_id, concurrency=concurrency))
+        return report
+
+    async def _resolve_scopes(self, models: Iterable[KupydoBaseModel]) -> Scopes:
+        scopes = dict()
+        for model_cls in {type(model) for model in models}:
+            if model_cls._api_group is not DynamicApi:
+                continue
+            self._actions(model_cls)
+            discovery = self._api_groups[DynamicApi].discovery
+            try:
+                resource = await discovery.resolve(model_cls._api_version, model_cls._kind)
+            except (errors.UnknownKindError, client.ApiException, ClientError):
+                continue
+            scopes[(model_cls._api_version, model_cls._kind)] = resource.namespaced
+        return scopes
+
+    async def wait_rollout(self, *deployments: Deployment, timeout: float = None) -> None:
+        list_func = self._actions(Deployment).list
+        await wait_rollouts(list_func, [d._key for d in deployments], timeout)
+
+    async def validate_all(self, registry: LocalRegistry, *, concurrency: int = None) -> ValidationReport:
+        report = ValidationReport(pending_namespaces={
+            model._values.name for model in registry
+            if model._kind == "Namespace"
+        })
+        semaphore = asyncio.Semaphore(concurrency or self._concurrency)
+
+        async def validate(model: KupydoBaseModel) -> None:
+            async with semaphore:
+                report.add(model._key, await self.apply(model, raw=True, dry_run=True))
+
+        with self._retry_batch():
+            await asyncio.gather(*map(validate, registry))
+        return report
+
+    async def prune(self,
+                    registry: LocalRegistry | list[KupydoBaseModel],
+                    deployment_id: str,
+                    *,
+                    kinds: Iterable[Type[KupydoBaseModel]] = None,
+                    concurrency: int = None
+                    ) -> dict[ObjectKey, Response[RawModel]]:
+        selector = owner_selector(deployment_id)
+        scopes = await self._resolve_scopes(registry)
+        keep = {scoped_key(model, scopes) for model in registry}
+        semaphore = asyncio.Semaphore(concurrency or self._concurrency)
+
+        async def find_stale(scope: PruneScope) -> list[KupydoBaseModel]:
+            model_cls, namespace = scope
+            async with semaphore:
+                found = self.list_metadata(
+                    model_cls,
+                    namespace=namespace,
+                    label_selector=selector
+                )
+                models = [model_cls._from_dict(item) async for item in found]
+                return [model for model in models if model._key not in keep]
+
+        async def delete(model: KupydoBaseModel) -> Response[RawModel]:
+            async with semaphore:
+                return await self.delete(model)
+
+        responses = dict()
+        for phase in prune_phases(registry, kinds):
+            found = await asyncio.gather(*map(find_stale, phase))
+            stale = [obj for objs in found for obj in objs]
+            deleted = await asyncio.gather(*map(delete, stale))
+            responses.update(zip([model._key for model in stale], deleted))
+        return responses
@@ -8,6 +8,14 @@
 #
 #   SPDX-License-Identifier: MIT
 #
+from __future__ import annotations
+import os
+import base64
+import orjson
+from pathlib import Path
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from kubernetes_asyncio.config.kube_config import KubeConfigLoader
 from kubernetes_asyncio.client import Configuration
 from kubernetes_asyncio.config import (
     load_kube_config_from_dict,
@@ -25,25 +33,121 @@ __all__ = [
     "list_kube_config_contexts",
     "load_incluster_config",
     "load_kube_config",
-    "autoload_config"
+    "autoload_config",
+    "load_context_config",
+    "clear_config_cache",
+    "context_namespace",
+    "list_context_names"
 ]
 
 
-async def autoload_config(raise_errors: bool = True) -> bool:
-    default = Configuration.get_default_copy()
-    if not default.host:
+_EXPIRY_SKEW = timedelta(minutes=5)
+_SERVICE_ACCOUNT_NAMESPACE = Path("/var/run/secrets/kubernetes.io/serviceaccount/namespace")
+
+
+@dataclass
+class _CachedConfig:
+    config: Configuration
+    loader: KubeConfigLoader | None
+    stamp: tuple
+    expires_at: datetime | None
+
+
+_config_cache: dict[str | None, _CachedConfig] = dict()
+
+
+def _kubeconfig_paths() -> list[Path]:
+    paths = os.environ.get("KUBECONFIG", "~/.kube/config")
+    return [Path(p).expanduser() for p in paths.split(os.pathsep) if p]
+
+
+def _kubeconfig_stamp() -> tuple:
+    return tuple(
+        (path.as_posix(), path.stat().st_mtime_ns if path.is_file() else None)
+        for path in _kubeconfig_paths()
+    )
+
+
+def _token_expiry(config: Configuration, loader: KubeConfigLoader | None) -> datetime | None:
+    if expiry := getattr(loader, "exec_plugin_expiry", None):
+        return expiry if expiry.tzinfo else expiry.replace(tzinfo=timezone.utc)
+    token = config.api_key.get("BearerToken", "").removeprefix("Bearer ")
+    parts = token.split(".")
+    if len(parts) != 3:
+        return None
+    try:
+        padding = "=" * (-len(parts[1]) % 4)
+        claims = orjson.loads(base64.urlsafe_b64decode(parts[1] + padding))
+        return datetime.fromtimestamp(claims["exp"], tz=timezone.utc)
+    except (ValueError, KeyError, TypeError, orjson.JSONDecodeError):
+        return None
+
+
+async def _load_config(context: str | None) -> _CachedConfig:
+    config = Configuration()
+    if context is None:
         try:
-            load_incluster_config()
+            load_incluster_config(client_configuration=config)
+            return _CachedConfig(config, None, ("incluster",), None)
         except ConfigException:
-            try:
-                await load_kube_config()
-            except ConfigException:
-                if not raise_errors:
-                    return False
-                raise RuntimeError("Unable to automatically load Kubernetes config.")
-        default = Configuration.get_default_copy()
-        if not default.host:
-            if not raise_errors:
-                return False
-            raise RuntimeError("Cannot use Kupydo ApiClient without Kubernetes config.")
+            pass
+    stamp = _kubeconfig_stamp()
+    config_file = os.pathsep.join(path for path, _ in stamp)
+    loader = await load_kube_config(
+        config_file=config_file,
+        context=context,
+        client_configuration=config
+    )
+    return _CachedConfig(config, loader, stamp, _token_expiry(config, loader))
+
+
+async def load_context_config(context: str = None) -> Configuration:
+    cached = _config_cache.get(context)
+    if cached is None or cached.loader and cached.stamp != _kubeconfig_stamp():
+        cached = _config_cache[context] = await _load_config(context)
+    elif cached.expires_at and cached.expires_at - _EXPIRY_SKEW <= datetime.now(timezone.utc):
+        await cached.loader.load_and_set(cached.config)
+        cached.expires_at = _token_expiry(cached.config, cached.loader)
+    if not cached.config.host:
+        raise RuntimeError("Cannot use Kupydo ApiClient without Kubernetes config.")
+    return cached.config
+
+
+def clear_config_cache() -> None:
+    _config_cache.clear()
+
+
+def context_namespace(context: str = None) -> str:
+    cached = _config_cache.get(context)
+    if cached is None:
+        return "default"
+    if cached.loader is None:
+        try:
+            return _SERVICE_ACCOUNT_NAMESPACE.read_text().strip() or "default"
+        except OSError:
+            return "default"
+    current = cached.loader.current_context or dict()
+    return current.get("context", dict()).get("namespace") or "default"
+
+
+def list_context_names() -> list[str]:
+    config_file = os.pathsep.join(path.as_posix() for path in _kubeconfig_paths())
+    contexts, _ = list_kube_config_contexts(config_file=config_file)
+    return [context["name"] for context in contexts]
+
+
+async def autoload_config(raise_errors: bool = True) -> bool:
+    if Configuration.get_default_copy().host:
+        return True
+    try:
+        default = await load_context_config()
+    except ConfigException:
+        if not raise_errors:
+            return False
+        raise RuntimeError("Unable to automatically load Kubernetes config.")
+    except RuntimeError:
+        if not raise_errors:
+            return False
+        raise
+    Configuration.set_default(default)
     return True
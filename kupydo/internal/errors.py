@@ -10,6 +10,7 @@
 #
 from pathlib import Path
 from typing import Literal
+from .types import ObjectKey
 
 
 __all__ = [
@@ -23,7 +24,12 @@ __all__ = [
     "InvalidPackageError",
     "AssetNotFoundError",
     "BadStatusFileError",
-    "InvalidPathTypeError"
+    "InvalidPathTypeError",
+    "DependencyCycleError",
+    "RolloutFailedError",
+    "RolloutTimeoutError",
+    "WaitTimeoutError",
+    "UnknownKindError"
 ]
 
 
@@ -88,3 +94,31 @@ class BadStatusFileError(KupydoBaseError):
 class InvalidPathTypeError(KupydoBaseError):
     def __init__(self, path: Path | str, expected: Literal["absolute", "relative"]):
         super().__init__(f"\nPath is not {expected}: {path}")
+
+
+class DependencyCycleError(KupydoBaseError):
+    def __init__(self, keys: list[ObjectKey]):
+        cycle = ", ".join(f"{k.kind}/{k.name}" for k in keys)
+        super().__init__(f"\nCannot order resources with cyclic dependencies: {cycle}")
+
+
+class RolloutFailedError(KupydoBaseError):
+    def __init__(self, key: ObjectKey, message: str):
+        super().__init__(f"\nRollout of {key.kind} '{key.namespace}/{key.name}' failed: {message}")
+
+
+class RolloutTimeoutError(KupydoBaseError):
+    def __init__(self, keys: list[ObjectKey]):
+        pending = ", ".join(f"{k.namespace}/{k.name}" for k in keys)
+        super().__init__(f"\nTimed out waiting for rollouts to converge: {pending}")
+
+
+class WaitTimeoutError(KupydoBaseError):
+    def __init__(self, keys: list[ObjectKey], state: str):
+        pending = ", ".join(f"{k.kind}/{k.name}" for k in keys)
+        super().__init__(f"\nTimed out waiting for resources to become {state}: {pending}")
+
+
+class UnknownKindError(KupydoBaseError):
+    def __init__(self, api_version: str, kind: str):
+        super().__init__(f"\nThe API server does not serve kind '{kind}' in '{api_version}'.")
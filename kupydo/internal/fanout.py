@@ -0,0 +1,90 @@
+#
+#   MIT License
+#
+#   Copyright (c) 2023, Mattias Aabmets
+#
+#   The contents of this file are subject to the terms and conditions defined in the License.
+#   You may not use, modify, or distribute this file except in compliance with the License.
+#
+#   SPDX-License-Identifier: MIT
+#
+from __future__ import annotations
+import asyncio
+from typing import Iterable, Any
+from dataclasses import dataclass, field
+from .api_ops import ApplyReport, resolve_deployment_id, stamp_owner
+from .client import ApiClient
+from .config import list_context_names
+from .registry import LocalRegistry
+from .response import Response
+from .types import ObjectKey
+
+
+__all__ = ["ClusterResult", "apply_to_contexts", "result_matrix"]
+
+
+@dataclass
+class ClusterResult:
+    context: str
+    report: ApplyReport = field(default_factory=ApplyReport)
+    error: Exception | None = None
+
+    @property
+    def failed(self) -> dict[ObjectKey, Response]:
+        return self.report.failed
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and self.report.ok
+
+
+async def apply_to_contexts(registry: LocalRegistry,
+                            contexts: Iterable[str] = None,
+                            *,
+                            deployment_id: str = None,
+                            prune: bool = False,
+                            skip_unchanged: bool = False,
+                            concurrency: int = 10,
+                            qps: float = None,
+                            burst: int = None,
+                            **client_options: Any
+                            ) -> dict[str, ClusterResult]:
+    contexts = list(contexts or list_context_names())
+    deployment_id = deployment_id or resolve_deployment_id(getattr(registry, "path", None))
+    models = stamp_owner(registry, deployment_id) if deployment_id else list(registry)
+    for model in models:
+        model._freeze()
+
+    async def apply_context(context: str) -> ClusterResult:
+        try:
+            async with ApiClient(
+                    context=context,
+                    concurrency=concurrency,
+                    qps=qps,
+                    burst=burst,
+                    **client_options) as api_client:
+                report = await api_client.apply_all(
+                    models,
+                    deployment_id=deployment_id,
+                    prune=prune,
+                    skip_unchanged=skip_unchanged
+                )
+            return ClusterResult(context, report)
+        except Exception as ex:
+            return ClusterResult(context, error=ex)
+
+    results = await asyncio.gather(*map(apply_context, contexts))
+    return {result.context: result for result in results}
+
+
+def result_matrix(registry: LocalRegistry,
+                  results: dict[str, ClusterResult]
+                  ) -> list[tuple[ObjectKey, dict[str, int | None]]]:
+    rows = list()
+    for model in registry:
+        codes = dict()
+        for context, result in results.items():
+            response = result.report.applied.get(model._key)
+            codes[context] = response.code if response else None
+        rows.append((model._key, codes))
+    return rows
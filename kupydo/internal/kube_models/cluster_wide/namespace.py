@@ -19,6 +19,11 @@ __all__ = ["Namespace"]
 
 
 class Namespace(KupydoClusterWideModel):
+    _api_group = client.CoreV1Api
+    _api_version = "v1"
+    _kind = "Namespace"
+    _plural = "namespaces"
+
     def __init__(self,
                  *,
                  name: str,
@@ -32,22 +37,23 @@ class Namespace(KupydoClusterWideModel):
 
     def _to_dict(self, new_values: DotMap = None) -> dict:
         v: KupydoBaseValues = new_values or self._values
-        return client.V1Namespace(
-            api_version="v1",
-            kind="Namespace",
-            metadata=client.V1ObjectMeta(
-                name=v.name,
-                annotations=v.annotations,
-                labels=v.labels
-            )
-        ).to_dict()
-
-    def _api(self, session: client.ApiClient) -> KupydoApiActions:
-        api = client.CoreV1Api(session)
+        return dict(
+            apiVersion=self._api_version,
+            kind=self._kind,
+            metadata=self._metadata(v)
+        )
+
+    @classmethod
+    def _is_ready(cls, obj: RawDict) -> bool:
+        return (obj.get("status") or dict()).get("phase") == "Active"
+
+    @classmethod
+    def _api(cls, api: client.CoreV1Api) -> KupydoApiActions:
         return KupydoApiActions(
             create=api.create_namespace,
             delete=api.delete_namespace,
             read=api.read_namespace,
             replace=api.replace_namespace,
-            patch=api.patch_namespace
+            patch=api.patch_namespace,
+            list=api.list_namespace
         )
@@ -28,6 +28,11 @@ class ConfigMapValues(KupydoBaseValues):
 
 
 class ConfigMap(KupydoNamespacedModel):
+    _api_group = client.CoreV1Api
+    _api_version = "v1"
+    _kind = "ConfigMap"
+    _plural = "configmaps"
+
     def __init__(self,
                  *,
                  name: str,
@@ -46,28 +51,35 @@ class ConfigMap(KupydoNamespacedModel):
 
     def _to_dict(self, new_values: DotMap = None) -> dict:
         v: ConfigMapValues = new_values or self._values
-        return client.V1ConfigMap(
-            api_version="v1",
-            kind="ConfigMap",
-            metadata=client.V1ObjectMeta(
-                name=v.name,
-                namespace=v.namespace,
-                annotations=v.annotations,
-                labels=v.labels
-            ),
-            immutable=v.immutable,
-            binary_data=v.binary_data,
-            data=v.data
-        ).to_dict()
+        return dict(
+            apiVersion=self._api_version,
+            kind=self._kind,
+            metadata=self._metadata(v),
+            **utils.compact_dict(
+                immutable=v.immutable,
+                binaryData=v.binary_data,
+                data=v.data
+            )
+        )
+
+    @classmethod
+    def _parse_values(cls, obj: dict) -> dict:
+        return dict(
+            **super()._parse_values(obj),
+            data=obj.get("data"),
+            binary_data=obj.get("binaryData"),
+            immutable=obj.get("immutable")
+        )
 
-    def _api(self, session: client.ApiClient) -> KupydoApiActions:
-        api = client.CoreV1Api(session)
+    @classmethod
+    def _api(cls, api: client.CoreV1Api) -> KupydoApiActions:
         return KupydoApiActions(
             create=api.create_namespaced_config_map,
             delete=api.delete_namespaced_config_map,
             read=api.read_namespaced_config_map,
             replace=api.replace_namespaced_config_map,
-            patch=api.patch_namespaced_config_map
+            patch=api.patch_namespaced_config_map,
+            list=api.list_namespaced_config_map
         )
 
     @staticmethod
@@ -1,14 +1,138 @@
 #
 #   MIT License
-#   
+#
 #   Copyright (c) 2023, Mattias Aabmets
-#   
+#
 #   The contents of this file are subject to the terms and conditions defined in the License.
 #   You may not use, modify, or distribute this file except in compliance with the License.
-#   
+#
 #   SPDX-License-Identifier: MIT
 #
+from __future__ import annotations as anno
+from dotmap import DotMap
+from kubernetes_asyncio import client
+from kupydo.internal.types import *
+from kupydo.internal.base import *
+from kupydo.internal import utils
+
+
+__all__ = ["DeploymentValues", "Deployment"]
+
+
+class DeploymentValues(KupydoBaseValues):
+    containers: list[dict]
+    init_containers: OptionalListDict
+    volumes: OptionalListDict
+    replicas: OptionalInt
+    pod_labels: OptionalDictStr
+    pod_annotations: OptionalDictStr
+    service_account_name: OptionalStr
+    strategy: OptionalDict
+    min_ready_seconds: OptionalInt
+
+
+class Deployment(KupydoNamespacedModel):
+    _api_group = client.AppsV1Api
+    _api_version = "apps/v1"
+    _kind = "Deployment"
+    _plural = "deployments"
+
+    def __init__(self,
+                 *,
+                 name: str,
+                 containers: list[dict],
+                 namespace: OptionalStr = None,
+                 annotations: OptionalDictStr = None,
+                 labels: OptionalDictStr = None,
+                 init_containers: OptionalListDict = None,
+                 volumes: OptionalListDict = None,
+                 replicas: OptionalInt = None,
+                 pod_labels: OptionalDictStr = None,
+                 pod_annotations: OptionalDictStr = None,
+                 service_account_name: OptionalStr = None,
+                 strategy: OptionalDict = None,
+                 min_ready_seconds: OptionalInt = None
+                 ) -> None:
+        pod_labels = pod_labels or dict(app=name)
+        super().__init__(
+            values=locals(),
+            validator=DeploymentValues
+        )
+
+    def _to_dict(self, new_values: DotMap = None) -> dict:
+        v: DeploymentValues = new_values or self._values
+        return dict(
+            apiVersion=self._api_version,
+            kind=self._kind,
+            metadata=self._metadata(v),
+            spec=utils.compact_dict(
+                replicas=v.replicas,
+                minReadySeconds=v.min_ready_seconds,
+                strategy=v.strategy,
+                selector=dict(matchLabels=v.pod_labels),
+                template=dict(
+                    metadata=utils.compact_dict(
+                        labels=v.pod_labels,
+                        annotations=v.pod_annotations
+                    ),
+                    spec=utils.compact_dict(
+                        serviceAccountName=v.service_account_name,
+                        initContainers=v.init_containers,
+                        containers=v.containers,
+                        volumes=v.volumes
+                    )
+                )
+            )
+        )
+
+    @classmethod
+    def _parse_values(cls, obj: dict) -> dict:
+        spec = obj.get("spec") or dict()
+        template = spec.get("template") or dict()
+        pod_meta, pod_spec = template.get("metadata") or dict(), template.get("spec") or dict()
+        return dict(
+            **super()._parse_values(obj),
+            containers=pod_spec.get("containers") or list(),
+            init_containers=pod_spec.get("initContainers"),
+            volumes=pod_spec.get("volumes"),
+            replicas=spec.get("replicas"),
+            pod_labels=pod_meta.get("labels"),
+            pod_annotations=pod_meta.get("annotations"),
+            service_account_name=pod_spec.get("serviceAccountName"),
+            strategy=spec.get("strategy"),
+            min_ready_seconds=spec.get("minReadySeconds")
+        )
 
+    @property
+    def _references(self) -> list[ObjectKey]:
+        v = self._values
+        names: set[tuple[str, str]] = set()
+        for volume in v.volumes or list():
+            if name := (volume.get("configMap") or dict()).get("name"):
+                names.add(("ConfigMap", name))
+            if name := (volume.get("secret") or dict()).get("secretName"):
+                names.add(("Secret", name))
+        for container in (v.init_containers or list()) + list(v.containers):
+            for source in container.get("envFrom") or list():
+                if name := (source.get("configMapRef") or dict()).get("name"):
+                    names.add(("ConfigMap", name))
+                if name := (source.get("secretRef") or dict()).get("name"):
+                    names.add(("Secret", name))
+            for env in container.get("env") or list():
+                value_from = env.get("valueFrom") or dict()
+                if name := (value_from.get("configMapKeyRef") or dict()).get("name"):
+                    names.add(("ConfigMap", name))
+                if name := (value_from.get("secretKeyRef") or dict()).get("name"):
+                    names.add(("Secret", name))
+        return [ObjectKey(kind, v.namespace, name) for kind, name in sorted(names)]
 
-class Deployment:
-    pass
+    @classmethod
+    def _api(cls, api: client.AppsV1Api) -> KupydoApiActions:
+        return KupydoApiActions(
+            create=api.create_namespaced_deployment,
+            delete=api.delete_namespaced_deployment,
+            read=api.read_namespaced_deployment,
+            replace=api.replace_namespaced_deployment,
+            patch=api.patch_namespaced_deployment,
+            list=api.list_namespaced_deployment
+        )
@@ -41,6 +41,11 @@ class BaseSecretValues(KupydoBaseValues):
 
 
 class BaseSecret(KupydoNamespacedModel):
+    _api_group = client.CoreV1Api
+    _api_version = "v1"
+    _kind = "Secret"
+    _plural = "secrets"
+
     def __init__(self,
                  *,
                  name: str,
@@ -59,29 +64,37 @@ class BaseSecret(KupydoNamespacedModel):
 
     def _to_dict(self, new_values: DotMap = None) -> dict:
         v: BaseSecretValues = new_values or self._values
-        return client.V1Secret(
-            api_version="v1",
-            kind="Secret",
-            metadata=client.V1ObjectMeta(
-                name=v.name,
-                namespace=v.namespace,
-                annotations=v.annotations,
-                labels=v.labels
-            ),
-            data=v.data,
-            string_data=v.string_data,
-            immutable=v.immutable,
-            type=v.subtype
-        ).to_dict()
+        return dict(
+            apiVersion=self._api_version,
+            kind=self._kind,
+            metadata=self._metadata(v),
+            **utils.compact_dict(
+                data=v.data,
+                stringData=v.string_data,
+                immutable=v.immutable,
+                type=v.subtype
+            )
+        )
+
+    @classmethod
+    def _parse_values(cls, obj: dict) -> dict:
+        return dict(
+            **super()._parse_values(obj),
+            data=obj.get("data"),
+            string_data=obj.get("stringData"),
+            immutable=obj.get("immutable"),
+            subtype=obj.get("type")
+        )
 
-    def _api(self, session: client.ApiClient) -> KupydoApiActions:
-        api = client.CoreV1Api(session)
+    @classmethod
+    def _api(cls, api: client.CoreV1Api) -> KupydoApiActions:
         return KupydoApiActions(
             create=api.create_namespaced_secret,
             delete=api.delete_namespaced_secret,
             read=api.read_namespaced_secret,
             replace=api.replace_namespaced_secret,
-            patch=api.patch_namespaced_secret
+            patch=api.patch_namespaced_secret,
+            list=api.list_namespaced_secret
         )
 
     @staticmethod
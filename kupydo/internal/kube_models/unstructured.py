@@ -0,0 +1,84 @@
+#
+#   MIT License
+#
+#   Copyright (c) 2023, Mattias Aabmets
+#
+#   The contents of this file are subject to the terms and conditions defined in the License.
+#   You may not use, modify, or distribute this file except in compliance with the License.
+#
+#   SPDX-License-Identifier: MIT
+#
+from __future__ import annotations as anno
+import re
+from typing import Type, Any
+from dotmap import DotMap
+from kupydo.internal.api_ops import DynamicApi
+from kupydo.internal.types import *
+from kupydo.internal.base import *
+from kupydo.internal import utils
+
+
+__all__ = ["UnstructuredValues", "Unstructured"]
+
+
+class UnstructuredValues(KupydoBaseValues):
+    body: dict[str, Any]
+
+
+class Unstructured(KupydoBaseModel):
+    _api_group = DynamicApi
+    _kinds: dict[tuple[str, str], Type[Unstructured]] = dict()
+
+    def __new__(cls, manifest: dict = None, *_, **__) -> Unstructured:
+        if cls is Unstructured:
+            cls = cls.of(manifest["apiVersion"], manifest["kind"])
+        return super().__new__(cls)
+
+    def __init__(self, manifest: dict) -> None:
+        super().__init__(
+            values=self._parse_values(manifest),
+            validator=UnstructuredValues
+        )
+
+    @classmethod
+    def of(cls, api_version: str, kind: str) -> Type[Unstructured]:
+        key = (api_version, kind)
+        if key not in cls._kinds:
+            suffix = re.sub(r"\W", "_", f"{api_version}_{kind}")
+            cls._kinds[key] = type(f"Unstructured_{suffix}", (Unstructured,), dict(
+                _api_version=api_version,
+                _kind=kind
+            ))
+        return cls._kinds[key]
+
+    @property
+    def _namespace(self) -> dict:
+        if namespace := self._values.namespace:
+            return dict(namespace=namespace)
+        return dict()
+
+    @classmethod
+    def _raw_type(cls) -> str:
+        return "object"
+
+    def _to_dict(self, new_values: DotMap = None) -> dict:
+        v: UnstructuredValues = new_values or self._values
+        body = utils.to_plain_dict(v.body)
+        metadata = dict(body.get("metadata") or dict(), **self._metadata(v))
+        return dict(
+            body,
+            apiVersion=self._api_version,
+            kind=self._kind,
+            metadata=metadata
+        )
+
+    @classmethod
+    def _parse_values(cls, obj: dict) -> dict:
+        return dict(
+            **super()._parse_values(obj),
+            body=obj
+        )
+
+    @classmethod
+    def _api(cls, api: DynamicApi) -> KupydoApiActions:
+        return api.actions(cls._api_version, cls._kind)
@@ -72,6 +72,13 @@ class ProjectPublicConfig(ProjectBaseConfig):
 					f"duplicate {key} values not allowed in public config file."
 		return data
 
+	def find_deployment(self, heart_path: Path) -> DeploymentPublicData | None:
+		heart_path = heart_path.resolve()
+		for deployment in self.deployments:
+			if utils.repo_rel_to_abs_path(deployment.path) == heart_path:
+				return deployment
+		return None
+
 	@staticmethod
 	def get_config_path() -> Path:
 		repo_path = utils.find_repo_path()
@@ -32,6 +32,7 @@ _ResourceTemplates = list[tuple[Type, dict[str, Any]]]
 class GlobalRegistry:
     _templates: _ResourceTemplates = list()
     _secrets: dict[str, SecretFieldDetails] = dict()
+    _path: Path | None = None
     _enabled: bool = False
     _silent: bool = False
 
@@ -47,7 +48,7 @@ class GlobalRegistry:
     def __new__(cls, *, namespace: str = 'default') -> LocalRegistry:
         if not cls._templates and not cls._silent:
             raise ResourcesMissingError
-        return LocalRegistry(cls._templates, namespace)
+        return LocalRegistry(cls._templates, namespace, cls._path)
 
     @classmethod
     @disabled_check
@@ -55,6 +56,7 @@ class GlobalRegistry:
         if not is_path_absolute(path) and not cls._silent:
             raise InvalidPathTypeError(path, "absolute")
         cls.reset()
+        cls._path = path
         spec = imp.spec_from_file_location(path.stem, path)
         module = imp.module_from_spec(spec)
         sys.modules[path.stem] = module
@@ -89,6 +91,7 @@ class GlobalRegistry:
     def reset(cls) -> None:
         cls._templates = list()
         cls._secrets = dict()
+        cls._path = None
 
     @classmethod
     def set_enabled(cls, state: bool) -> None:
@@ -108,8 +111,9 @@ class GlobalRegistry:
 
 
 class LocalRegistry(list):
-    def __init__(self, templates: _ResourceTemplates, namespace: str) -> None:
+    def __init__(self, templates: _ResourceTemplates, namespace: str, path: Path = None) -> None:
         super().__init__()
+        self.path = path
         for [model, values] in templates:
             dynamic = DynamicTypeRegistry.get(model)
             dm_vals = DotMap(values, _prevent_method_masking=True)
@@ -127,6 +131,8 @@ class DynamicTypeRegistry:
 
     @classmethod
     def get(cls, model: Type) -> Type:
+        if model in cls._dynamic_types.values():
+            return model
         name = model.__name__.lower()
         if name not in cls._dynamic_types:
             cls._dynamic_types[name] = type(
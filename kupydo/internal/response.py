@@ -13,7 +13,6 @@ from typing import Callable, Generic, Any
 from kubernetes_asyncio.client import ApiException
 from aiohttp.client import ClientError
 from dataclasses import dataclass
-from functools import partial
 from rich.panel import Panel
 from rich import print
 from .base import KupydoBaseModel
@@ -43,10 +42,9 @@ class Response(Generic[RawModel]):
 
 
 def error_handler(coro: Callable) -> Callable:
-    async def closure(_self, model: KupydoBaseModel, *args) -> Response[RawModel]:
+    async def closure(_self, model: KupydoBaseModel, *args, **kwargs) -> Response[RawModel]:
         try:
-            c = partial(coro, _self, model)
-            raw = await c(*args) if args else await c()
+            raw = await coro(_self, model, *args, **kwargs)
             return Response(code=200, raw=raw)
         except (ApiException, ClientError, Exception) as error:
             if isinstance(error, ApiException):
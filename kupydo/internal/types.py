@@ -12,27 +12,42 @@ from pydantic import Field
 from kubernetes_asyncio import client
 from typing import (
     Callable, Coroutine, Annotated,
-    TypeVar, Type, Optional, Any
+    NamedTuple, TypeVar, Type, Optional, Any
 )
 
 
 __all__ = [
     "AsyncCallable",
+    "ObjectKey",
     "OptionalStr",
     "OptionalBool",
+    "OptionalInt",
     "OptionalListStr",
     "OptionalDictStr",
+    "OptionalListDict",
+    "OptionalDict",
     "ApiType",
+    "RawDict",
     "RawModel"
 ]
 
 
 AsyncCallable = Callable[..., Coroutine[Any, Any, Any]]
 
+
+class ObjectKey(NamedTuple):
+    kind: str
+    namespace: Optional[str]
+    name: str
+
+
 OptionalStr = Annotated[Optional[str], Field(default=None)]
 OptionalBool = Annotated[Optional[bool], Field(default=None)]
+OptionalInt = Annotated[Optional[int], Field(default=None)]
 OptionalListStr = Annotated[Optional[list[str]], Field(default=None)]
 OptionalDictStr = Annotated[Optional[dict[str, str]], Field(default=None)]
+OptionalDict = Annotated[Optional[dict[str, Any]], Field(default=None)]
+OptionalListDict = Annotated[Optional[list[dict[str, Any]]], Field(default=None)]
 
 
 ApiType = TypeVar(
@@ -45,8 +60,10 @@ ApiType = TypeVar(
     Type[client.RbacAuthorizationV1Api],
     Type[client.PolicyV1Api]
 )
+RawDict = dict[str, Any]
 RawModel = TypeVar(
     'RawModel',
+    RawDict,
     client.V1ConfigMap,
     client.V1CronJob,
     client.V1Deployment,
@@ -22,6 +22,10 @@ __all__ = [
 	"read_cached_file_lines",
 	"generate_name",
 	"deep_merge",
+	"compact_dict",
+	"manifest_hash",
+	"to_plain_dict",
+	"merge_patch",
 	"find_lib_path",
 	"find_repo_path",
 	"is_path_absolute",
@@ -8,15 +8,21 @@
 #
 #   SPDX-License-Identifier: MIT
 #
+import orjson
 import random
 import string
+import hashlib
 from dotmap import DotMap
-from typing import Literal, TypeVar, Mapping
+from typing import Literal, TypeVar, Mapping, Any
 
 
 __all__ = [
     "generate_name",
-    "deep_merge"
+    "deep_merge",
+    "compact_dict",
+    "manifest_hash",
+    "to_plain_dict",
+    "merge_patch"
 ]
 
 
@@ -53,3 +59,45 @@ def deep_merge(base: T,
         else:
             base[key] = value
     return base
+
+
+def compact_dict(**fields: Any) -> dict[str, Any]:
+    return {k: v for k, v in fields.items() if v is not None}
+
+
+def _plain_mapping(obj: Any) -> dict:
+    if isinstance(obj, DotMap):
+        return obj.toDict()
+    if isinstance(obj, dict):
+        return dict(obj)
+    raise TypeError
+
+
+def _dump_plain(manifest: dict, option: int = 0) -> bytes:
+    return orjson.dumps(
+        manifest,
+        default=_plain_mapping,
+        option=option | orjson.OPT_PASSTHROUGH_SUBCLASS
+    )
+
+
+def manifest_hash(manifest: dict) -> str:
+    data = _dump_plain(manifest, orjson.OPT_SORT_KEYS)
+    return hashlib.sha256(data).hexdigest()
+
+
+def to_plain_dict(manifest: dict | DotMap) -> dict:
+    return orjson.loads(_dump_plain(manifest))
+
+
+def merge_patch(old: dict, new: dict) -> dict:
+    patch = {key: None for key in old.keys() - new.keys()}
+    for key, value in new.items():
+        if key not in old:
+            patch[key] = value
+        elif isinstance(value, dict) and isinstance(old[key], dict):
+            if nested := merge_patch(old[key], value):
+                patch[key] = nested
+        elif value != old[key]:
+            patch[key] = value
+    return patch
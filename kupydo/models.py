@@ -9,3 +9,4 @@
 #   SPDX-License-Identifier: MIT
 #
 from kupydo.internal.kube_models.namespaced import *
+from kupydo.internal.kube_models.unstructured import Unstructured
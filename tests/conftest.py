@@ -0,0 +1,102 @@
+#
+#   MIT License
+#
+#   Copyright (c) 2023, Mattias Aabmets
+#
+#   The contents of this file are subject to the terms and conditions defined in the License.
+#   You may not use, modify, or distribute this file except in compliance with the License.
+#
+#   SPDX-License-Identifier: MIT
+#
+import asyncio
+import orjson
+import pytest
+from kubernetes_asyncio import client
+from kupydo.internal import client as client_module
+from kupydo.internal.base import KupydoApiActions
+from kupydo.internal.client import ApiClient
+
+
+class FakeResponse:
+    def __init__(self,
+                 payload: dict = None,
+                 events: list[dict] = None,
+                 status: int = 200,
+                 hang: bool = False
+                 ) -> None:
+        self.status = status
+        self.reason = "OK"
+        self.headers = dict()
+        self._payload = payload
+        self._events = events or []
+        self._hang = hang
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *_):
+        pass
+
+    async def read(self) -> bytes:
+        return orjson.dumps(self._payload)
+
+    @property
+    async def content(self):
+        for event in self._events:
+            yield orjson.dumps(event) + b"\n"
+        if self._hang:
+            await asyncio.Event().wait()
+
+
+@pytest.fixture(name="fake_response")
+def fixture_fake_response() -> type[FakeResponse]:
+    return FakeResponse
+
+
+@pytest.fixture(name="actions")
+def fixture_actions(mocker) -> KupydoApiActions:
+    return KupydoApiActions(*[mocker.AsyncMock(name=name) for name in (
+        "create", "delete", "read", "replace", "patch", "list",
+        "read_metadata", "list_metadata", "list_all"
+    )])
+
+
+@pytest.fixture(name="make_api")
+def fixture_make_api(mocker):
+    config = client.Configuration(host="https://cluster.example:6443")
+    mocker.patch.object(client_module, "load_context_config", mocker.AsyncMock(return_value=config))
+    mocker.patch.object(client_module, "create_session", mocker.AsyncMock(
+        side_effect=lambda *_: mocker.Mock(
+            close=mocker.AsyncMock(),
+            deserialize=client.ApiClient.__new__(client.ApiClient).deserialize
+        )
+    ))
+
+    def make_api(**kwargs) -> ApiClient:
+        kwargs.setdefault("retry_policy", None)
+        return ApiClient(**kwargs)
+    return make_api
+
+
+@pytest.fixture(name="make_list_func")
+def fixture_make_list_func():
+    def make_list_func(items: list[dict] = None,
+                       streams: list[list[dict]] = None,
+                       *,
+                       kind: str = "ConfigMapList",
+                       resource_version: str = "1",
+                       hang: bool = True):
+        calls, streams = list(), list(streams or [])
+
+        async def list_func(**kwargs):
+            calls.append(kwargs)
+            if kwargs.get("watch"):
+                return FakeResponse(events=streams.pop(0) if streams else [], hang=hang)
+            return FakeResponse(dict(
+                apiVersion="v1",
+                kind=kind,
+                metadata=dict(resourceVersion=resource_version),
+                items=items or []
+            ))
+        return list_func, calls
+    return make_list_func
@@ -0,0 +1,75 @@
+#
+#   MIT License
+#
+#   Copyright (c) 2023, Mattias Aabmets
+#
+#   The contents of this file are subject to the terms and conditions defined in the License.
+#   You may not use, modify, or distribute this file except in compliance with the License.
+#
+#   SPDX-License-Identifier: MIT
+#
+import ssl
+import pytest
+from kubernetes_asyncio import client
+from kupydo.internal.api_ops import ConnectionSettings, create_session
+
+
+@pytest.fixture(name="config")
+def fixture_config():
+    config = client.Configuration(host="https://cluster.example:6443")
+    config.verify_ssl = True
+    return config
+
+
+def test_ssl_context_verifies_by_default(config):
+    context = ConnectionSettings().ssl_context(config)
+    assert context.verify_mode == ssl.CERT_REQUIRED
+    assert context.check_hostname is True
+
+
+def test_ssl_context_without_verification(config):
+    config.verify_ssl = False
+    context = ConnectionSettings().ssl_context(config)
+    assert context.verify_mode == ssl.CERT_NONE
+    assert context.check_hostname is False
+
+
+def test_ssl_context_relaxes_strict_verification(mocker, config):
+    create_default_context = ssl.create_default_context
+
+    def strict_context(**kwargs):
+        context = create_default_context(**kwargs)
+        context.verify_flags |= ssl.VERIFY_X509_STRICT
+        return context
+
+    mocker.patch("ssl.create_default_context", side_effect=strict_context)
+    context = ConnectionSettings().ssl_context(config)
+    assert context.verify_flags & ssl.VERIFY_X509_STRICT
+
+    config.disable_strict_ssl_verification = True
+    context = ConnectionSettings().ssl_context(config)
+    assert not context.verify_flags & ssl.VERIFY_X509_STRICT
+
+
+async def test_connector_limits(config):
+    settings = ConnectionSettings(pool_size=250, pool_size_per_host=50, keepalive_timeout=30.0)
+    connector = settings.connector(config)
+    assert connector.limit == 250
+    assert connector.limit_per_host == 50
+    assert connector.use_dns_cache is True
+    await connector.close()
+
+
+async def test_connector_without_dns_cache(config):
+    connector = ConnectionSettings(dns_cache_ttl=None).connector(config)
+    assert connector.use_dns_cache is False
+    await connector.close()
+
+
+async def test_create_session_replaces_default_pool(mocker, config):
+    close = mocker.spy(client.rest.aiohttp.ClientSession, "close")
+    session = await create_session(config, ConnectionSettings(pool_size=7))
+    assert close.call_count == 1
+    assert session.rest_client.pool_manager.connector.limit == 7
+    assert not session.rest_client.pool_manager.closed
+    await session.close()
@@ -0,0 +1,80 @@
+#
+#   MIT License
+#
+#   Copyright (c) 2023, Mattias Aabmets
+#
+#   The contents of this file are subject to the terms and conditions defined in the License.
+#   You may not use, modify, or distribute this file except in compliance with the License.
+#
+#   SPDX-License-Identifier: MIT
+#
+import os
+import pytest
+from kupydo.internal.api_ops import DiscoveryCache, ApiResource
+from kupydo.internal import errors
+
+
+RESOURCES = dict(
+    kind="APIResourceList",
+    groupVersion="example.com/v1",
+    resources=[
+        dict(name="widgets", kind="Widget", namespaced=True),
+        dict(name="widgets/status", kind="Widget", namespaced=True),
+        dict(name="gadgets", kind="Gadget", namespaced=False)
+    ]
+)
+
+
+@pytest.fixture(name="api_client")
+def fixture_api_client(mocker, fake_response):
+    api_client = mocker.Mock()
+    api_client.configuration.host = "https://10.0.0.1:6443"
+    api_client.call_api = mocker.AsyncMock(side_effect=lambda *_, **__: fake_response(RESOURCES))
+    yield api_client
+    DiscoveryCache.clear()
+
+
+async def test_resolves_and_caches_in_memory(api_client, tmp_path):
+    cache = DiscoveryCache(api_client, cache_dir=tmp_path)
+    widget = await cache.resolve("example.com/v1", "Widget")
+    gadget = await cache.resolve("example.com/v1", "Gadget")
+    assert widget == ApiResource("example.com/v1", "widgets", "Widget", True)
+    assert gadget.namespaced is False
+    assert api_client.call_api.await_count == 1
+    assert api_client.call_api.await_args.args == ("/apis/example.com/v1", "GET")
+
+
+async def test_disk_cache_survives_new_process(api_client, tmp_path):
+    await DiscoveryCache(api_client, cache_dir=tmp_path).resolve("example.com/v1", "Widget")
+    cache_file = tmp_path / "10.0.0.1_6443" / "example.com" / "v1" / "serverresources.json"
+    assert cache_file.is_file()
+
+    DiscoveryCache.clear()
+    await DiscoveryCache(api_client, cache_dir=tmp_path).resolve("example.com/v1", "Gadget")
+    assert api_client.call_api.await_count == 1
+
+
+async def test_expired_disk_cache_is_refetched(api_client, tmp_path):
+    await DiscoveryCache(api_client, cache_dir=tmp_path, ttl=60).resolve("example.com/v1", "Widget")
+    cache_file = next(tmp_path.rglob("serverresources.json"))
+    os.utime(cache_file, (0, 0))
+
+    DiscoveryCache.clear()
+    await DiscoveryCache(api_client, cache_dir=tmp_path, ttl=60).resolve("example.com/v1", "Widget")
+    assert api_client.call_api.await_count == 2
+
+
+async def test_unknown_kind_refreshes_once_then_raises(api_client, tmp_path):
+    cache = DiscoveryCache(api_client, cache_dir=tmp_path)
+    with pytest.raises(errors.UnknownKindError):
+        await cache.resolve("example.com/v1", "Gizmo")
+    assert api_client.call_api.await_count == 2
+
+
+def test_resource_paths():
+    widget = ApiResource("example.com/v1", "widgets", "Widget", True)
+    gadget = ApiResource("example.com/v1", "gadgets", "Gadget", False)
+    pod = ApiResource("v1", "pods", "Pod", True)
+    assert widget.path("ns", "w") == "/apis/example.com/v1/namespaces/ns/widgets/w"
+    assert gadget.path("ns", "g") == "/apis/example.com/v1/gadgets/g"
+    assert pod.path("ns") == "/api/v1/namespaces/ns/pods"
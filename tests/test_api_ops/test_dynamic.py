@@ -0,0 +1,51 @@
+#
+#   MIT License
+#
+#   Copyright (c) 2023, Mattias Aabmets
+#
+#   The contents of this file are subject to the terms and conditions defined in the License.
+#   You may not use, modify, or distribute this file except in compliance with the License.
+#
+#   SPDX-License-Identifier: MIT
+#
+import pytest
+from kupydo.internal.api_ops import DynamicApi, ApiResource
+
+
+WIDGET = ApiResource("example.com/v1", "widgets", "Widget", True)
+GADGET = ApiResource("example.com/v1", "gadgets", "Gadget", False)
+
+
+@pytest.fixture(name="dynamic_api")
+def fixture_dynamic_api(mocker, fake_response):
+    api_client = mocker.Mock()
+    api_client.configuration.host = "https://10.0.0.1:6443"
+    api_client.call_api = mocker.AsyncMock(side_effect=lambda *_, **__: fake_response(dict()))
+    api = DynamicApi(api_client, namespace="team")
+    resources = dict(Widget=WIDGET, Gadget=GADGET)
+    mocker.patch.object(api.discovery, "resolve", mocker.AsyncMock(
+        side_effect=lambda _, kind: resources[kind]
+    ))
+    return api
+
+
+async def test_namespaced_create_defaults_to_context_namespace(dynamic_api):
+    body = dict(metadata=dict(name="w"))
+    await dynamic_api.actions("example.com/v1", "Widget").create(body=body)
+    args, kwargs = dynamic_api.api_client.call_api.await_args
+    assert args == ("/apis/example.com/v1/namespaces/team/widgets", "POST")
+    assert kwargs["body"] is body
+
+
+async def test_namespaced_list_without_namespace_spans_namespaces(dynamic_api):
+    await dynamic_api.actions("example.com/v1", "Widget").list(_preload_content=False)
+    args, _ = dynamic_api.api_client.call_api.await_args
+    assert args == ("/apis/example.com/v1/widgets", "GET")
+
+
+async def test_cluster_scoped_body_drops_namespace(dynamic_api):
+    body = dict(metadata=dict(name="g", namespace="ns"))
+    await dynamic_api.actions("example.com/v1", "Gadget").create(body=body, namespace="ns")
+    args, kwargs = dynamic_api.api_client.call_api.await_args
+    assert args == ("/apis/example.com/v1/gadgets", "POST")
+    assert kwargs["body"]["metadata"] == dict(name="g")
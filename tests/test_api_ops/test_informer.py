@@ -0,0 +1,75 @@
+#
+#   MIT License
+#
+#   Copyright (c) 2023, Mattias Aabmets
+#
+#   The contents of this file are subject to the terms and conditions defined in the License.
+#   You may not use, modify, or distribute this file except in compliance with the License.
+#
+#   SPDX-License-Identifier: MIT
+#
+import asyncio
+import pytest
+from kubernetes_asyncio.client import ApiException
+from kupydo.internal.api_ops import Informer
+
+
+def configmap(name: str, version: str) -> dict:
+    metadata = dict(name=name, namespace="default", resourceVersion=version)
+    return dict(metadata=metadata, data=dict(key=version))
+
+
+@pytest.fixture(name="informer_list_func")
+def fixture_informer_list_func(make_list_func):
+    def informer_list_func(events: list[dict]):
+        return make_list_func([configmap("alpha", "5")], [events], resource_version="10")
+    return informer_list_func
+
+
+async def test_initial_list_fills_store(informer_list_func):
+    list_func, calls = informer_list_func([])
+    informer = Informer(list_func, namespace="default")
+    await informer.start()
+    assert informer.synced
+    assert informer.get("alpha")["kind"] == "ConfigMap"
+    assert informer.get("alpha")["apiVersion"] == "v1"
+    assert calls[0] == dict(namespace="default", limit=500, _preload_content=False)
+    await informer.stop()
+    assert not informer.synced
+
+
+async def test_watch_events_update_store(informer_list_func):
+    events = [
+        dict(type="ADDED", object=configmap("beta", "11")),
+        dict(type="MODIFIED", object=configmap("alpha", "12")),
+        dict(type="DELETED", object=configmap("beta", "13")),
+        dict(type="BOOKMARK", object=dict(metadata=dict(resourceVersion="14")))
+    ]
+    list_func, calls = informer_list_func(events)
+    informer = Informer(list_func)
+    await informer.start()
+    await asyncio.sleep(0.01)
+    assert calls[1]["resource_version"] == "10"
+    assert calls[1]["allow_watch_bookmarks"] is True
+    assert informer.get("alpha", "default")["data"]["key"] == "12"
+    assert informer.get("alpha") is None
+    assert informer.get("beta", "default") is None
+    assert informer._resource_version == "14"
+    await informer.stop()
+
+
+async def test_expired_watch_triggers_relist(informer_list_func):
+    informer = Informer(informer_list_func([])[0])
+    assert informer._handle(dict(type="ERROR", object=dict(code=410))) is False
+    with pytest.raises(Exception):
+        informer._handle(dict(type="ERROR", object=dict(code=500, reason="Boom")))
+
+
+async def test_failed_watch_is_not_synced(informer_list_func):
+    list_func, _ = informer_list_func([dict(type="ERROR", object=dict(code=500, reason="Boom"))])
+    informer = Informer(list_func)
+    await informer.start(wait=False)
+    await asyncio.sleep(0.01)
+    assert not informer.synced
+    with pytest.raises(ApiException):
+        await informer.wait_synced()
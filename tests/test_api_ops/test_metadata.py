@@ -0,0 +1,54 @@
+#
+#   MIT License
+#
+#   Copyright (c) 2023, Mattias Aabmets
+#
+#   The contents of this file are subject to the terms and conditions defined in the License.
+#   You may not use, modify, or distribute this file except in compliance with the License.
+#
+#   SPDX-License-Identifier: MIT
+#
+from kupydo.internal.api_ops import *
+from kupydo.internal.kube_models.cluster_wide.namespace import Namespace
+from kupydo.internal.kube_models.namespaced.secret import BaseSecret
+
+
+def test_metadata_query_uses_wire_names():
+    query = metadata_query(
+        limit=50,
+        _continue="token",
+        label_selector="app=web",
+        field_selector=None,
+        _preload_content=False
+    )
+    assert query == [("limit", 50), ("continue", "token"), ("labelSelector", "app=web")]
+
+
+async def test_read_metadata_requests_partial_object(mocker):
+    api_client = mocker.Mock(call_api=mocker.AsyncMock())
+    read_metadata, _ = metadata_actions(api_client, BaseSecret)
+    await read_metadata(name="token", namespace="ns", _preload_content=False)
+    args, kwargs = api_client.call_api.await_args
+    assert args == ("/api/v1/namespaces/ns/secrets/token", "GET")
+    assert kwargs["header_params"]["Accept"].startswith(PARTIAL_METADATA)
+    assert kwargs["_preload_content"] is False
+
+
+async def test_list_metadata_requests_partial_object_list(mocker):
+    api_client = mocker.Mock(call_api=mocker.AsyncMock())
+    _, list_metadata = metadata_actions(api_client, Namespace)
+    await list_metadata(limit=10, label_selector="a=b")
+    args, kwargs = api_client.call_api.await_args
+    assert args == ("/api/v1/namespaces", "GET")
+    assert kwargs["header_params"]["Accept"].startswith(PARTIAL_METADATA_LIST)
+    assert kwargs["query_params"] == [("limit", 10), ("labelSelector", "a=b")]
+
+
+async def test_list_all_spans_namespaces(mocker):
+    api_client = mocker.Mock(call_api=mocker.AsyncMock())
+    list_all = list_all_action(api_client, BaseSecret)
+    await list_all(watch=True, resource_version="10")
+    args, kwargs = api_client.call_api.await_args
+    assert args == ("/api/v1/secrets", "GET")
+    assert kwargs["header_params"]["Accept"] == "application/json"
+    assert kwargs["query_params"] == [("watch", True), ("resourceVersion", "10")]
@@ -0,0 +1,67 @@
+#
+#   MIT License
+#
+#   Copyright (c) 2023, Mattias Aabmets
+#
+#   The contents of this file are subject to the terms and conditions defined in the License.
+#   You may not use, modify, or distribute this file except in compliance with the License.
+#
+#   SPDX-License-Identifier: MIT
+#
+import pytest
+from kubernetes_asyncio.client import ApiException
+from kupydo.internal.api_ops import paginate_resource
+
+
+@pytest.fixture(name="paged_list_func")
+def fixture_paged_list_func(fake_response):
+    def paged_list_func(pages: list[list[str]]):
+        calls = []
+
+        async def list_func(**kwargs):
+            calls.append(kwargs)
+            index = len(calls) - 1
+            token = str(index + 1) if index + 1 < len(pages) else None
+            return fake_response(dict(
+                apiVersion="v1",
+                kind="SecretList",
+                metadata=dict(resourceVersion="7", **({"continue": token} if token else {})),
+                items=[dict(metadata=dict(name=name)) for name in pages[index]]
+            ))
+        return list_func, calls
+    return paged_list_func
+
+
+async def test_follows_continue_tokens(paged_list_func):
+    list_func, calls = paged_list_func([["a", "b"], ["c", "d"], ["e"]])
+    names = []
+    async for items, _ in paginate_resource(list_func, 2, namespace="ns"):
+        names.extend(item["metadata"]["name"] for item in items)
+    assert names == ["a", "b", "c", "d", "e"]
+    assert [c.get("_continue") for c in calls] == [None, "1", "2"]
+    assert all(c["limit"] == 2 and c["namespace"] == "ns" for c in calls)
+
+
+async def test_items_get_kind_and_api_version(paged_list_func):
+    list_func, _ = paged_list_func([["a"]])
+    async for items, metadata in paginate_resource(list_func):
+        assert items[0]["kind"] == "Secret"
+        assert items[0]["apiVersion"] == "v1"
+        assert metadata["resourceVersion"] == "7"
+
+
+async def test_stops_early_without_fetching_more(paged_list_func):
+    list_func, calls = paged_list_func([["a"], ["b"]])
+    pages = paginate_resource(list_func)
+    async for _ in pages:
+        break
+    await pages.aclose()
+    assert len(calls) == 1
+
+
+async def test_error_status_raises(fake_response):
+    async def list_func(**_):
+        return fake_response(dict(code=403), status=403)
+    with pytest.raises(ApiException):
+        async for _ in paginate_resource(list_func):
+            pass
@@ -0,0 +1,74 @@
+#
+#   MIT License
+#
+#   Copyright (c) 2023, Mattias Aabmets
+#
+#   The contents of this file are subject to the terms and conditions defined in the License.
+#   You may not use, modify, or distribute this file except in compliance with the License.
+#
+#   SPDX-License-Identifier: MIT
+#
+import orjson
+from kupydo.internal.api_ops import *
+from kupydo.internal.kube_models.cluster_wide.namespace import Namespace
+from kupydo.internal.kube_models.namespaced.configmap import ConfigMap
+from kupydo.internal.kube_models.namespaced.secret import OpaqueSecret
+
+
+def test_stamp_owner_keeps_existing_labels():
+    models = [
+        ConfigMap(name="a", namespace="ns", labels=dict(app="web")),
+        Namespace(name="ns")
+    ]
+    stamped = stamp_owner(models, "abc")
+    assert stamped[0]._render()["metadata"]["labels"] == {"app": "web", OWNER_LABEL: "abc"}
+    assert stamped[1]._render()["metadata"]["labels"] == {OWNER_LABEL: "abc"}
+    assert stamped[0].content_hash != models[0].content_hash
+    assert owner_selector("abc") == f"{OWNER_LABEL}=abc"
+
+
+def test_stamp_owner_leaves_models_untouched():
+    model = ConfigMap(name="a", namespace="ns", labels=dict(app="web"))
+    stamped = stamp_owner([model], "abc")
+    assert model._values.labels == {"app": "web"}
+    assert model._render()["metadata"]["labels"] == {"app": "web"}
+    assert stamp_owner(stamped, "abc")[0] is stamped[0]
+
+
+def test_prune_phases_cover_every_kind_and_namespace():
+    models = [
+        Namespace(name="one"),
+        ConfigMap(name="a", namespace="one"),
+        ConfigMap(name="b", namespace="two")
+    ]
+    namespaced, cluster_wide = prune_phases(models, kinds=[OpaqueSecret, ConfigMap])
+    assert [(cls._kind, ns) for cls, ns in namespaced] == [
+        ("ConfigMap", "one"), ("ConfigMap", "two"),
+        ("Secret", "one"), ("Secret", "two")
+    ]
+    assert cluster_wide == [(Namespace, None)]
+
+
+def test_prune_phases_default_to_every_listable_kind():
+    namespaced, cluster_wide = prune_phases([ConfigMap(name="a", namespace="one")])
+    assert {cls._kind for cls, _ in namespaced} >= {"ConfigMap", "Secret", "Deployment"}
+    assert all(ns == "one" for _, ns in namespaced)
+    assert [cls._kind for cls, _ in cluster_wide] == ["Namespace"]
+
+
+def test_resolve_deployment_id_from_project_config(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / ".git").mkdir()
+    heart = tmp_path / "clusters" / "dev" / "Heart.py"
+    heart.parent.mkdir(parents=True)
+    heart.touch()
+    assert resolve_deployment_id(heart) is None
+    (tmp_path / ".kupydo").write_bytes(orjson.dumps(dict(deployments=[dict(
+        id="c5027735a24c3daa00fbc655b8aa20f3",
+        alias="dev",
+        path="clusters/dev/Heart.py",
+        pubkey="age17qyz09pyjxfwyxdjwyugw7wxy8gtk0gc23t7y9qqxccg6hr8uyqsqlmh2k"
+    )])))
+    assert resolve_deployment_id(heart) == "c5027735a24c3daa00fbc655b8aa20f3"
+    assert resolve_deployment_id(tmp_path / "Heart.py") is None
+    assert resolve_deployment_id(None) is None
@@ -0,0 +1,52 @@
+#
+#   MIT License
+#
+#   Copyright (c) 2023, Mattias Aabmets
+#
+#   The contents of this file are subject to the terms and conditions defined in the License.
+#   You may not use, modify, or distribute this file except in compliance with the License.
+#
+#   SPDX-License-Identifier: MIT
+#
+import time
+import asyncio
+import pytest
+from kupydo.internal.api_ops import TokenBucket
+
+
+def test_invalid_qps():
+    with pytest.raises(ValueError):
+        TokenBucket(qps=0)
+
+
+def test_default_burst():
+    assert TokenBucket(qps=20)._burst == 20
+    assert TokenBucket(qps=0.5)._burst == 1
+
+
+async def test_burst_is_immediate():
+    bucket = TokenBucket(qps=1, burst=5)
+    start = time.monotonic()
+    for _ in range(5):
+        await bucket.acquire()
+    assert time.monotonic() - start < 0.05
+
+
+async def test_sustained_rate_is_limited():
+    bucket = TokenBucket(qps=50, burst=5)
+    start = time.monotonic()
+    await asyncio.gather(*[bucket.acquire() for _ in range(10)])
+    elapsed = time.monotonic() - start
+    assert 0.08 <= elapsed < 0.5, \
+        "five requests beyond the burst should take about 0.1 seconds"
+
+
+async def test_wrap_acquires_before_call(mocker):
+    bucket = TokenBucket(qps=10)
+    acquire = mocker.spy(bucket, "acquire")
+
+    async def func(value, *, key):
+        return value, key
+
+    assert await bucket.wrap(func)(1, key=2) == (1, 2)
+    assert acquire.call_count == 1
@@ -0,0 +1,108 @@
+#
+#   MIT License
+#
+#   Copyright (c) 2023, Mattias Aabmets
+#
+#   The contents of this file are subject to the terms and conditions defined in the License.
+#   You may not use, modify, or distribute this file except in compliance with the License.
+#
+#   SPDX-License-Identifier: MIT
+#
+import pytest
+from aiohttp import ServerDisconnectedError
+from kubernetes_asyncio.client import ApiException
+from kupydo.internal.api_ops import RetryPolicy
+
+
+SLEEP = "kupydo.internal.api_ops.retry_policy.asyncio.sleep"
+
+
+def api_error(status: int, retry_after: str = None) -> ApiException:
+    error = ApiException(status=status, reason="error")
+    error.headers = {"Retry-After": retry_after} if retry_after else {}
+    return error
+
+
+def failing_func(*errors: Exception):
+    calls = list(errors)
+
+    async def func():
+        if calls:
+            raise calls.pop(0)
+        return "ok"
+    return func
+
+
+def test_backoff_is_capped():
+    policy = RetryPolicy(base_delay=1, max_delay=3)
+    for attempt in range(10):
+        assert 0 <= policy.backoff(attempt) <= 3
+
+
+def test_retry_after_parsing():
+    assert RetryPolicy.retry_after(api_error(429, "7")) == 7.0
+    assert RetryPolicy.retry_after(api_error(429, "soon")) is None
+    assert RetryPolicy.retry_after(api_error(429)) is None
+
+
+async def test_retries_transient_errors(mocker):
+    sleep = mocker.patch(SLEEP)
+    func = failing_func(api_error(503), ServerDisconnectedError())
+    assert await RetryPolicy().wrap(func)() == "ok"
+    assert sleep.call_count == 2
+
+
+async def test_honors_retry_after(mocker):
+    sleep = mocker.patch(SLEEP)
+    func = failing_func(api_error(429, "4"))
+    assert await RetryPolicy().wrap(func)() == "ok"
+    sleep.assert_called_once_with(4.0)
+
+
+async def test_does_not_retry_client_errors(mocker):
+    sleep = mocker.patch(SLEEP)
+    func = failing_func(api_error(409))
+    with pytest.raises(ApiException):
+        await RetryPolicy().wrap(func)()
+    sleep.assert_not_called()
+
+
+async def test_gives_up_after_max_attempts(mocker):
+    mocker.patch(SLEEP)
+    func = failing_func(*[api_error(500)] * 3)
+    with pytest.raises(ApiException):
+        await RetryPolicy(max_attempts=3).wrap(func)()
+
+
+async def test_respects_deadline(mocker):
+    sleep = mocker.patch(SLEEP)
+    func = failing_func(api_error(429, "30"))
+    with pytest.raises(ApiException):
+        await RetryPolicy(deadline=10).wrap(func)()
+    sleep.assert_not_called()
+
+
+async def test_batch_budget_is_shared(mocker):
+    mocker.patch(SLEEP)
+    policy = RetryPolicy(batch_retries=1)
+    with policy.batch() as budget:
+        assert await policy.wrap(failing_func(api_error(503)))() == "ok"
+        with pytest.raises(ApiException):
+            await policy.wrap(failing_func(api_error(503)))()
+    assert budget.remaining == 0
+
+
+async def test_non_idempotent_calls_skip_server_errors(mocker):
+    sleep = mocker.patch(SLEEP)
+    with pytest.raises(ApiException):
+        await RetryPolicy().wrap(failing_func(api_error(503)), idempotent=False)()
+    with pytest.raises(ServerDisconnectedError):
+        await RetryPolicy().wrap(failing_func(ServerDisconnectedError()), idempotent=False)()
+    sleep.assert_not_called()
+
+
+async def test_non_idempotent_calls_retry_throttling(mocker):
+    sleep = mocker.patch(SLEEP)
+    func = failing_func(api_error(429, "1"))
+    assert await RetryPolicy().wrap(func, idempotent=False)() == "ok"
+    sleep.assert_called_once_with(1.0)
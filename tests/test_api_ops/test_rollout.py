@@ -0,0 +1,90 @@
+#
+#   MIT License
+#
+#   Copyright (c) 2023, Mattias Aabmets
+#
+#   The contents of this file are subject to the terms and conditions defined in the License.
+#   You may not use, modify, or distribute this file except in compliance with the License.
+#
+#   SPDX-License-Identifier: MIT
+#
+import pytest
+from kupydo.internal.api_ops import rollout_status, wait_rollouts
+from kupydo.internal.types import ObjectKey
+from kupydo.internal import errors
+
+
+def deployment(name: str, generation: int = 1, observed: int = 1, updated: int = 2,
+               available: int = 2, total: int = 2, replicas: int = 2, conditions: list = None) -> dict:
+    return dict(
+        metadata=dict(name=name, generation=generation, resourceVersion="1"),
+        spec=dict(replicas=replicas),
+        status=dict(
+            observedGeneration=observed,
+            updatedReplicas=updated,
+            availableReplicas=available,
+            replicas=total,
+            conditions=conditions or []
+        )
+    )
+
+
+@pytest.fixture(name="deployment_list_func")
+def fixture_deployment_list_func(make_list_func):
+    def deployment_list_func(streams: dict[str, list[dict]]):
+        calls = []
+        funcs = {
+            namespace: make_list_func(streams=[events], kind="DeploymentList")[0]
+            for namespace, events in streams.items()
+        }
+
+        async def list_func(namespace: str, **kwargs):
+            if kwargs.get("watch"):
+                calls.append(namespace)
+            return await funcs[namespace](**kwargs)
+        return list_func, calls
+    return deployment_list_func
+
+
+@pytest.mark.parametrize("obj, complete, failed", [
+    (deployment("a"), True, False),
+    (deployment("a", generation=2), False, False),
+    (deployment("a", updated=1, total=2), False, False),
+    (deployment("a", total=3), False, False),
+    (deployment("a", available=1), False, False),
+    (deployment("a", conditions=[dict(type="Progressing", reason="ProgressDeadlineExceeded")]), False, True)
+])
+def test_rollout_status(obj, complete, failed):
+    state = rollout_status(obj)
+    assert (state.complete, state.failed) == (complete, failed)
+
+
+async def test_waits_on_one_watch_per_namespace(deployment_list_func):
+    list_func, calls = deployment_list_func({
+        "one": [
+            dict(type="ADDED", object=deployment("a", updated=0)),
+            dict(type="ADDED", object=deployment("b")),
+            dict(type="MODIFIED", object=deployment("a"))
+        ],
+        "two": [dict(type="ADDED", object=deployment("c"))]
+    })
+    keys = [
+        ObjectKey("Deployment", "one", "a"),
+        ObjectKey("Deployment", "one", "b"),
+        ObjectKey("Deployment", "two", "c")
+    ]
+    await wait_rollouts(list_func, keys, timeout=1)
+    assert sorted(calls) == ["one", "two"]
+
+
+async def test_failed_rollout_raises(deployment_list_func):
+    conditions = [dict(type="Progressing", reason="ProgressDeadlineExceeded", message="stuck")]
+    list_func, _ = deployment_list_func({"one": [dict(type="ADDED", object=deployment("a", conditions=conditions))]})
+    with pytest.raises(errors.RolloutFailedError):
+        await wait_rollouts(list_func, [ObjectKey("Deployment", "one", "a")], timeout=1)
+
+
+async def test_timeout_reports_pending(deployment_list_func):
+    list_func, _ = deployment_list_func({"one": [dict(type="ADDED", object=deployment("a", available=0))]})
+    with pytest.raises(errors.RolloutTimeoutError, match="one/a"):
+        await wait_rollouts(list_func, [ObjectKey("Deployment", "one", "a")], timeout=0.05)
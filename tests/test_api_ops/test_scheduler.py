@@ -0,0 +1,106 @@
+#
+#   MIT License
+#
+#   Copyright (c) 2023, Mattias Aabmets
+#
+#   The contents of this file are subject to the terms and conditions defined in the License.
+#   You may not use, modify, or distribute this file except in compliance with the License.
+#
+#   SPDX-License-Identifier: MIT
+#
+import asyncio
+import pytest
+from kupydo.internal.api_ops import DependencyScheduler
+from kupydo.internal.response import Response, ErrorDetails
+from kupydo.internal.errors import DependencyCycleError
+from kupydo.internal.types import ObjectKey
+from kupydo.cluster.models import Namespace
+from kupydo.models import ConfigMap, Unstructured
+
+
+@pytest.fixture(name="models")
+def fixture_models():
+    return [
+        ConfigMap(name="cm-a", namespace="ns-a"),
+        ConfigMap(name="cm-b", namespace="ns-b"),
+        Namespace(name="ns-a"),
+        ConfigMap(name="cm-c", namespace="default")
+    ]
+
+
+def test_waves_order_namespaces_first(models):
+    waves = DependencyScheduler(models).waves
+    assert [[m.values.name for m in wave] for wave in waves] == [
+        ["cm-b", "ns-a", "cm-c"],
+        ["cm-a"]
+    ]
+
+
+def test_unstructured_scope_comes_from_discovery():
+    gadget = Unstructured(dict(
+        apiVersion="example.com/v1",
+        kind="Gadget",
+        metadata=dict(name="g", namespace="ns-a")
+    ))
+    models = [gadget, Namespace(name="ns-a")]
+    assert len(DependencyScheduler(models).waves) == 2
+    scopes = {("example.com/v1", "Gadget"): False}
+    assert len(DependencyScheduler(models, scopes).waves) == 1
+
+
+class LinkedConfigMap(ConfigMap):
+    def __init__(self, refs: list[str], **kwargs):
+        super().__init__(**kwargs)
+        self._refs = refs
+
+    @property
+    def _references(self) -> list[ObjectKey]:
+        return [ObjectKey("ConfigMap", "default", name) for name in self._refs]
+
+
+def test_waves_follow_explicit_references():
+    first = LinkedConfigMap([], name="first", namespace="default")
+    second = LinkedConfigMap(["first"], name="second", namespace="default")
+    waves = DependencyScheduler([second, first]).waves
+    assert [[m.values.name for m in wave] for wave in waves] == [["first"], ["second"]]
+
+
+def test_cyclic_references_raise():
+    a = LinkedConfigMap(["b"], name="a", namespace="default")
+    b = LinkedConfigMap(["a"], name="b", namespace="default")
+    with pytest.raises(DependencyCycleError):
+        _ = DependencyScheduler([a, b]).waves
+
+
+async def test_run_starts_dependents_when_ready(models):
+    started = list()
+    release = {name: asyncio.Event() for name in ["cm-a", "cm-b", "ns-a", "cm-c"]}
+
+    async def operation(model):
+        started.append(model.values.name)
+        await release[model.values.name].wait()
+        return Response(code=200)
+
+    task = asyncio.create_task(DependencyScheduler(models).run(operation, 10))
+    await asyncio.sleep(0.01)
+    assert sorted(started) == ["cm-b", "cm-c", "ns-a"]
+
+    release["ns-a"].set()
+    await asyncio.sleep(0.01)
+    assert "cm-a" in started
+
+    for event in release.values():
+        event.set()
+    responses = await task
+    assert all(r.code == 200 for r in responses)
+
+
+async def test_run_skips_dependents_of_failures(models):
+    async def operation(model):
+        if model.values.name == "ns-a":
+            return Response(code=500, error=ErrorDetails("", "", ""))
+        return Response(code=200)
+
+    responses = await DependencyScheduler(models).run(operation, 2)
+    assert [r.code for r in responses] == [424, 200, 500, 200]
+    assert responses[0].error.reason == "DependencyFailed"
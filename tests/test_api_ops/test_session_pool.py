@@ -0,0 +1,83 @@
+#
+#   MIT License
+#
+#   Copyright (c) 2023, Mattias Aabmets
+#
+#   The contents of this file are subject to the terms and conditions defined in the License.
+#   You may not use, modify, or distribute this file except in compliance with the License.
+#
+#   SPDX-License-Identifier: MIT
+#
+import asyncio
+import pytest
+from kupydo.internal.api_ops import SessionPool
+
+
+@pytest.fixture(name="factory")
+def fixture_factory(mocker):
+    async def factory():
+        await asyncio.sleep(0)
+        return mocker.AsyncMock()
+    return mocker.AsyncMock(side_effect=factory)
+
+
+@pytest.fixture(autouse=True)
+async def reset_pool():
+    yield
+    await SessionPool.shutdown_all()
+
+
+async def test_concurrent_acquires_share_one_session(factory):
+    sessions = await asyncio.gather(*[
+        SessionPool.acquire("ctx", factory) for _ in range(5)
+    ])
+    assert all(s is sessions[0] for s in sessions)
+    assert factory.await_count == 1
+    assert SessionPool.borrowed("ctx") == 5
+
+
+async def test_released_sessions_stay_warm(factory):
+    first = await SessionPool.acquire("ctx", factory)
+    SessionPool.release("ctx")
+    assert SessionPool.borrowed("ctx") == 0
+    second = await SessionPool.acquire("ctx", factory)
+    assert first is second
+    first.close.assert_not_awaited()
+
+
+async def test_keys_get_separate_sessions(factory):
+    a = await SessionPool.acquire("ctx-a", factory)
+    b = await SessionPool.acquire("ctx-b", factory)
+    assert a is not b
+
+
+async def test_shutdown_all_closes_sessions(factory):
+    session = await SessionPool.acquire("ctx", factory)
+    await SessionPool.shutdown_all()
+    session.close.assert_awaited_once()
+    assert SessionPool.borrowed("ctx") == 0
+
+
+async def test_failed_factory_is_not_cached(mocker):
+    factory = mocker.AsyncMock(side_effect=RuntimeError)
+    with pytest.raises(RuntimeError):
+        await SessionPool.acquire("ctx", factory)
+    assert "ctx" not in SessionPool._entries
+
+
+async def test_idle_sessions_are_closed_after_timeout(mocker, factory):
+    mocker.patch.object(SessionPool, "idle_timeout", 0.01)
+    session = await SessionPool.acquire("ctx", factory)
+    SessionPool.release("ctx")
+    await asyncio.sleep(0.05)
+    session.close.assert_awaited_once()
+    assert "ctx" not in SessionPool._entries
+
+
+async def test_reacquire_cancels_idle_close(mocker, factory):
+    mocker.patch.object(SessionPool, "idle_timeout", 0.01)
+    session = await SessionPool.acquire("ctx", factory)
+    SessionPool.release("ctx")
+    assert await SessionPool.acquire("ctx", factory) is session
+    await asyncio.sleep(0.05)
+    session.close.assert_not_awaited()
@@ -0,0 +1,71 @@
+#
+#   MIT License
+#
+#   Copyright (c) 2023, Mattias Aabmets
+#
+#   The contents of this file are subject to the terms and conditions defined in the License.
+#   You may not use, modify, or distribute this file except in compliance with the License.
+#
+#   SPDX-License-Identifier: MIT
+#
+import asyncio
+import pytest
+from kupydo.internal.api_ops import SingleFlight
+
+
+def make_fetch():
+    calls = []
+
+    async def fetch(value: str = "result"):
+        calls.append(value)
+        await asyncio.sleep(0.01)
+        return dict(value=value)
+    return fetch, calls
+
+
+async def test_concurrent_calls_share_one_request():
+    flight = SingleFlight()
+    fetch, calls = make_fetch()
+    results = await asyncio.gather(*[flight.do("key", fetch) for _ in range(10)])
+    assert len(calls) == 1
+    assert all(r is results[0] for r in results)
+
+
+async def test_different_keys_do_not_coalesce():
+    flight = SingleFlight()
+    fetch, calls = make_fetch()
+    await asyncio.gather(flight.do("a", fetch), flight.do("b", fetch))
+    assert len(calls) == 2
+
+
+async def test_completed_calls_are_not_cached():
+    flight = SingleFlight()
+    fetch, calls = make_fetch()
+    await flight.do("key", fetch)
+    await flight.do("key", fetch)
+    assert len(calls) == 2
+    assert not flight._calls
+
+
+async def test_errors_reach_every_waiter():
+    flight = SingleFlight()
+
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise RuntimeError("boom")
+
+    results = await asyncio.gather(*[flight.do("key", fail) for _ in range(3)], return_exceptions=True)
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+
+async def test_cancelled_waiter_does_not_cancel_others():
+    flight = SingleFlight()
+    fetch, calls = make_fetch()
+    first = asyncio.create_task(flight.do("key", fetch))
+    second = asyncio.create_task(flight.do("key", fetch))
+    await asyncio.sleep(0)
+    first.cancel()
+    assert await second == dict(value="result")
+    with pytest.raises(asyncio.CancelledError):
+        await first
+    assert len(calls) == 1
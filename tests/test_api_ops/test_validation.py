@@ -0,0 +1,42 @@
+#
+#   MIT License
+#
+#   Copyright (c) 2023, Mattias Aabmets
+#
+#   The contents of this file are subject to the terms and conditions defined in the License.
+#   You may not use, modify, or distribute this file except in compliance with the License.
+#
+#   SPDX-License-Identifier: MIT
+#
+from kupydo.internal.api_ops import ValidationReport
+from kupydo.internal.response import Response, ErrorDetails
+from kupydo.internal.types import ObjectKey
+
+
+def error(code: int, reason: str, **details) -> Response:
+    return Response(code=code, error=ErrorDetails(
+        status="Failure",
+        reason=reason,
+        message=reason,
+        details=details or None
+    ))
+
+
+def test_report_classifies_results():
+    report = ValidationReport(pending_namespaces={"new"})
+    ok = ObjectKey("Namespace", None, "new")
+    deferred = ObjectKey("ConfigMap", "new", "a")
+    missing = ObjectKey("ConfigMap", "gone", "b")
+    invalid = ObjectKey("Secret", "new", "c")
+    report.add(ok, Response(code=200, raw=dict()))
+    report.add(deferred, error(404, "NotFound", name="new", kind="namespaces"))
+    report.add(missing, error(404, "NotFound", name="gone", kind="namespaces"))
+    report.add(invalid, error(422, "Invalid"))
+    assert report.passed == [ok]
+    assert report.deferred == [deferred]
+    assert list(report.failed) == [missing, invalid]
+    assert not report.ok
+
+
+def test_empty_report_is_ok():
+    assert ValidationReport().ok
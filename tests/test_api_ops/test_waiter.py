@@ -0,0 +1,77 @@
+#
+#   MIT License
+#
+#   Copyright (c) 2023, Mattias Aabmets
+#
+#   The contents of this file are subject to the terms and conditions defined in the License.
+#   You may not use, modify, or distribute this file except in compliance with the License.
+#
+#   SPDX-License-Identifier: MIT
+#
+import pytest
+from kupydo.internal.api_ops import wait_for_keys
+from kupydo.internal.kube_models.cluster_wide.namespace import Namespace
+from kupydo.internal.types import ObjectKey
+from kupydo.internal import errors
+
+
+def namespace(name: str, phase: str) -> dict:
+    return dict(metadata=dict(name=name, resourceVersion="6"), status=dict(phase=phase))
+
+
+@pytest.fixture(name="namespace_list_func")
+def fixture_namespace_list_func(make_list_func):
+    def namespace_list_func(items: list[dict], events: list[dict]):
+        return make_list_func(items, [events], kind="NamespaceList", resource_version="5")
+    return namespace_list_func
+
+
+def is_active(event: str, obj: dict | None) -> bool:
+    return event not in ("ABSENT", "DELETED") and Namespace._is_ready(obj)
+
+
+def is_deleted(event: str, _) -> bool:
+    return event in ("ABSENT", "DELETED")
+
+
+def keys(*names: str) -> list[ObjectKey]:
+    return [ObjectKey("Namespace", None, name) for name in names]
+
+
+def timeout_error(state: str):
+    return lambda pending: errors.WaitTimeoutError(pending, state)
+
+
+async def test_single_namespace_uses_field_selector(namespace_list_func):
+    list_func, calls = namespace_list_func(
+        items=[namespace("a", "Pending")],
+        events=[dict(type="MODIFIED", object=namespace("a", "Active"))]
+    )
+    await wait_for_keys(list_func, keys("a"), is_active, timeout_error("ready"), timeout=1)
+    assert calls[0]["field_selector"] == "metadata.name=a"
+    assert calls[1]["watch"] is True and calls[1]["resource_version"] == "5"
+
+
+async def test_batch_deletion_over_one_watch(namespace_list_func):
+    list_func, calls = namespace_list_func(
+        items=[namespace("a", "Terminating"), namespace("b", "Terminating")],
+        events=[
+            dict(type="DELETED", object=namespace("a", "Terminating")),
+            dict(type="DELETED", object=namespace("b", "Terminating"))
+        ]
+    )
+    await wait_for_keys(list_func, keys("a", "b", "c"), is_deleted, timeout_error("deleted"), timeout=1)
+    assert "field_selector" not in calls[0]
+    assert sum(1 for c in calls if c.get("watch")) == 1
+
+
+async def test_already_satisfied_skips_watch(namespace_list_func):
+    list_func, calls = namespace_list_func(items=[], events=[])
+    await wait_for_keys(list_func, keys("gone"), is_deleted, timeout_error("deleted"), timeout=1)
+    assert len(calls) == 1
+
+
+async def test_timeout_names_pending_objects(namespace_list_func):
+    list_func, _ = namespace_list_func(items=[namespace("a", "Terminating")], events=[])
+    with pytest.raises(errors.WaitTimeoutError, match="Namespace/a"):
+        await wait_for_keys(list_func, keys("a"), is_deleted, timeout_error("deleted"), timeout=0.05)
@@ -0,0 +1,67 @@
+#
+#   MIT License
+#
+#   Copyright (c) 2023, Mattias Aabmets
+#
+#   The contents of this file are subject to the terms and conditions defined in the License.
+#   You may not use, modify, or distribute this file except in compliance with the License.
+#
+#   SPDX-License-Identifier: MIT
+#
+import pytest
+from kubernetes_asyncio.client import ApiException
+from kupydo.internal.api_ops import watch_resource
+
+
+def obj(name: str, version: str) -> dict:
+    return dict(metadata=dict(name=name, resourceVersion=version))
+
+
+async def collect(generator, count: int) -> list:
+    events = []
+    async for event in generator:
+        events.append(event)
+        if len(events) == count:
+            break
+    await generator.aclose()
+    return events
+
+
+async def test_reconnects_from_last_resource_version(make_list_func):
+    list_func, calls = make_list_func(streams=[
+        [dict(type="ADDED", object=obj("a", "11"))],
+        [dict(type="BOOKMARK", object=obj("", "12"))],
+        [dict(type="MODIFIED", object=obj("a", "13"))]
+    ], hang=False)
+    events = await collect(watch_resource(list_func, "10", namespace="ns"), 2)
+    assert [(e.type, e.resource_version) for e in events] == [("ADDED", "11"), ("MODIFIED", "13")]
+    assert [c["resource_version"] for c in calls] == ["10", "11", "12"]
+    assert all(c["namespace"] == "ns" for c in calls)
+
+
+async def test_gone_relists_and_emits_differences(make_list_func):
+    list_func, calls = make_list_func(
+        streams=[
+            [dict(type="ADDED", object=obj("a", "11")),
+             dict(type="ADDED", object=obj("b", "12")),
+             dict(type="ADDED", object=obj("e", "13")),
+             dict(type="ERROR", object=dict(code=410))],
+            [dict(type="ADDED", object=obj("d", "51"))]
+        ],
+        items=[obj("a", "11"), obj("c", "40"), obj("e", "45")],
+        resource_version="50",
+        hang=False
+    )
+    events = await collect(watch_resource(list_func), 7)
+    assert [(e.type, e.object["metadata"]["name"]) for e in events] == [
+        ("ADDED", "a"), ("ADDED", "b"), ("ADDED", "e"),
+        ("DELETED", "b"), ("ADDED", "c"), ("MODIFIED", "e"),
+        ("ADDED", "d")
+    ]
+    assert calls[-1]["resource_version"] == "50"
+
+
+async def test_other_errors_are_raised(make_list_func):
+    list_func, _ = make_list_func(streams=[[dict(type="ERROR", object=dict(code=500))]])
+    with pytest.raises(ApiException):
+        await collect(watch_resource(list_func), 1)
@@ -0,0 +1,89 @@
+#
+#   MIT License
+#
+#   Copyright (c) 2023, Mattias Aabmets
+#
+#   The contents of this file are subject to the terms and conditions defined in the License.
+#   You may not use, modify, or distribute this file except in compliance with the License.
+#
+#   SPDX-License-Identifier: MIT
+#
+import pytest
+from kubernetes_asyncio.client import ApiException
+from kupydo.models import ConfigMap
+
+
+async def test_patch_sends_only_changed_fields(actions):
+    model = ConfigMap(name="a", namespace="ns", data=dict(one="1", two="2"))
+    await model.patch(actions, ConfigMap(name="a", data=dict(two="3")))
+    kwargs = actions.patch.await_args.kwargs
+    assert kwargs["_content_type"] == "application/merge-patch+json"
+    assert kwargs["body"]["data"] == dict(two="3")
+    assert model.values.data == dict(one="1", two="3")
+
+
+async def test_empty_patch_reads_current_object(actions):
+    model = ConfigMap(name="a", namespace="ns", data=dict(one="1"))
+    actions.read.return_value = "current"
+    assert await model.patch(actions, ConfigMap(name="a", data=dict(one="1"))) == "current"
+    actions.patch.assert_not_awaited()
+    actions.read.assert_awaited_once_with(name="a", namespace="ns")
+
+
+async def test_upsert_replaces_existing_object_with_its_version(actions, fake_response):
+    model = ConfigMap(name="a", namespace="ns", data=dict(one="1"))
+    actions.create.side_effect = ApiException(status=409)
+    actions.read.return_value = fake_response(dict(metadata=dict(name="a", resourceVersion="7")))
+    actions.replace.return_value = "replaced"
+    assert await model.upsert(actions) == "replaced"
+    body = actions.replace.await_args.kwargs["body"]
+    assert body["metadata"]["resourceVersion"] == "7"
+    assert body["data"] == dict(one="1")
+
+
+async def test_upsert_raises_after_max_attempts(actions, fake_response):
+    model = ConfigMap(name="a", namespace="ns")
+    actions.create.side_effect = ApiException(status=409)
+    actions.read.side_effect = lambda **_: fake_response(dict(metadata=dict(resourceVersion="7")))
+    actions.replace.side_effect = ApiException(status=409)
+    with pytest.raises(ApiException):
+        await model.upsert(actions, max_attempts=2)
+    assert actions.replace.await_count == 2
+    assert actions.read.await_count == 2
+
+
+async def test_upsert_does_not_retry_other_errors(actions):
+    model = ConfigMap(name="a", namespace="ns")
+    actions.create.side_effect = ApiException(status=403)
+    with pytest.raises(ApiException):
+        await model.upsert(actions)
+    actions.read.assert_not_awaited()
+
+
+async def test_apply_sends_server_side_apply_patch(actions):
+    model = ConfigMap(name="a", namespace="ns", data=dict(one="1"))
+    await model.apply(actions, field_manager="tester", force=False)
+    kwargs = actions.patch.await_args.kwargs
+    assert kwargs["_content_type"] == "application/apply-patch+yaml"
+    assert kwargs["field_manager"] == "tester"
+    assert kwargs["force"] is False
+    assert kwargs["body"]["data"] == dict(one="1")
+    assert "dry_run" not in kwargs
+
+
+async def test_apply_dry_run_is_forwarded(actions):
+    await ConfigMap(name="a", namespace="ns").apply(actions, dry_run="All")
+    assert actions.patch.await_args.kwargs["dry_run"] == "All"
+
+
+async def test_raw_invoke_returns_plain_dict(actions, fake_response):
+    actions.read.return_value = fake_response(dict(metadata=dict(name="a")))
+    assert await ConfigMap(name="a", namespace="ns").read(actions, raw=True) == dict(metadata=dict(name="a"))
+    assert actions.read.await_args.kwargs["_preload_content"] is False
+
+
+async def test_raw_invoke_raises_on_error_status(actions, fake_response):
+    actions.read.return_value = fake_response(dict(reason="NotFound"), status=404)
+    with pytest.raises(ApiException) as info:
+        await ConfigMap(name="a", namespace="ns").read(actions, raw=True)
+    assert info.value.status == 404
@@ -0,0 +1,58 @@
+#
+#   MIT License
+#
+#   Copyright (c) 2023, Mattias Aabmets
+#
+#   The contents of this file are subject to the terms and conditions defined in the License.
+#   You may not use, modify, or distribute this file except in compliance with the License.
+#
+#   SPDX-License-Identifier: MIT
+#
+import pytest
+from typer.testing import CliRunner
+from kupydo.internal.cli.main import app
+from kupydo.internal.api_ops import ApplyReport
+from kupydo.internal.fanout import ClusterResult
+from kupydo.internal.registry import GlobalRegistry
+from kupydo.internal.response import Response
+from kupydo.internal.types import ObjectKey
+
+
+APPLY = "kupydo.internal.cli.commands.apply.apply_to_contexts"
+KEY = ObjectKey("ConfigMap", "web", "settings")
+
+
+@pytest.fixture(name="heart")
+def fixture_heart(tmp_path):
+    path = tmp_path / "Heart.py"
+    path.write_text(
+        "from kupydo.internal.kube_models.namespaced.configmap import ConfigMap\n"
+        "ConfigMap(name='settings', data=dict(key='value'))\n"
+    )
+    yield path
+    GlobalRegistry.set_enabled(True)
+    GlobalRegistry.reset()
+    GlobalRegistry.set_enabled(False)
+
+
+def test_apply_prints_codes_per_context(heart, mocker):
+    apply = mocker.patch(APPLY, mocker.AsyncMock(return_value=dict(
+        one=ClusterResult("one", ApplyReport(applied={KEY: Response(code=200)})),
+        two=ClusterResult("two", ApplyReport(applied={KEY: Response(code=304)}))
+    )))
+    result = CliRunner().invoke(app, ["apply", "-c", "one", "-c", "two", "-n", "web", str(heart)])
+    assert result.exit_code == 0, result.output
+    assert "ConfigMap/web/settings" in result.output
+    registry, contexts = apply.await_args.args
+    assert contexts == ["one", "two"]
+    assert [model._key for model in registry] == [KEY]
+    assert apply.await_args.kwargs["deployment_id"] is None
+
+
+def test_apply_exits_with_error_on_failure(heart, mocker):
+    mocker.patch(APPLY, mocker.AsyncMock(return_value=dict(
+        one=ClusterResult("one", error=RuntimeError("no host"))
+    )))
+    result = CliRunner().invoke(app, ["apply", "-n", "web", "--deployment-id", "abc", str(heart)])
+    assert result.exit_code == 1
+    assert "no host" in result.output
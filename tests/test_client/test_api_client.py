@@ -0,0 +1,204 @@
+#
+#   MIT License
+#
+#   Copyright (c) 2023, Mattias Aabmets
+#
+#   The contents of this file are subject to the terms and conditions defined in the License.
+#   You may not use, modify, or distribute this file except in compliance with the License.
+#
+#   SPDX-License-Identifier: MIT
+#
+import asyncio
+import pytest
+from kubernetes_asyncio import client
+from kupydo.internal import client as client_module
+from kupydo.internal.api_ops import OWNER_LABEL, ApiResource, DynamicApi
+from kupydo.internal.client import ApiClient
+from kupydo.internal.response import Response
+from kupydo.internal.types import ObjectKey
+from kupydo.internal import errors
+from kupydo.internal.kube_models.namespaced.configmap import ConfigMap
+from kupydo.internal.kube_models.namespaced.secret import OpaqueSecret
+from kupydo.internal.kube_models.unstructured import Unstructured
+
+
+async def test_autoconfig_uses_live_cached_config(mocker):
+    live = client.Configuration(host="https://live:6443")
+    mocker.patch.object(client_module, "load_context_config", mocker.AsyncMock(return_value=live))
+    create = mocker.patch.object(client_module, "create_session", mocker.AsyncMock())
+    async with ApiClient(context="test"):
+        pass
+    client_module.load_context_config.assert_awaited_once_with("test")
+    assert create.await_args.args[0] is live
+
+
+async def test_informer_without_namespace_spans_namespaces(make_api, actions):
+    async with make_api() as api:
+        api._action_tables[ConfigMap] = actions
+        informer = await api.start_informer(ConfigMap, wait=False)
+        assert informer._list_func is actions.list_all
+        informer = await api.start_informer(ConfigMap, namespace="ns", wait=False)
+        assert informer._list_func is actions.list
+
+
+async def test_list_without_namespace_spans_namespaces(make_api, actions, fake_response):
+    actions.list_all.return_value = fake_response(dict(
+        apiVersion="v1",
+        kind="ConfigMapList",
+        metadata=dict(resourceVersion="1"),
+        items=[dict(metadata=dict(name="a", namespace="x")), dict(metadata=dict(name="b", namespace="y"))]
+    ))
+    async with make_api() as api:
+        api._action_tables[ConfigMap] = actions
+        items = [item async for item in api.list(ConfigMap, raw=True)]
+    assert [item["metadata"]["namespace"] for item in items] == ["x", "y"]
+    actions.list.assert_not_awaited()
+    assert "namespace" not in actions.list_all.await_args.kwargs
+
+
+async def test_apply_all_reports_prunes_separately(make_api, mocker):
+    registry = [ConfigMap(name="a", namespace="ns")]
+    stale = ObjectKey("ConfigMap", "ns", "old")
+    async with make_api() as api:
+        mocker.patch.object(api, "apply", mocker.AsyncMock(return_value=Response(code=200)))
+        mocker.patch.object(api, "prune", mocker.AsyncMock(return_value={stale: Response(code=200)}))
+        report = await api.apply_all(registry, deployment_id="abc", prune=True)
+    assert list(report.applied) == [registry[0]._key]
+    assert list(report.pruned) == [stale]
+    applied = api.apply.await_args.args[0]
+    assert applied._render()["metadata"]["labels"] == {OWNER_LABEL: "abc"}
+    assert registry[0]._values.labels is None
+
+
+async def test_wait_timeout_is_raised_after_successful_write(make_api, actions, mocker):
+    model = ConfigMap(name="a", namespace="ns")
+    actions.create.return_value = dict(metadata=dict(name="a"))
+    async with make_api() as api:
+        api._action_tables[ConfigMap] = actions
+        mocker.patch.object(api, "wait_ready", mocker.AsyncMock(
+            side_effect=errors.WaitTimeoutError([model._key], "ready")
+        ))
+        with pytest.raises(errors.WaitTimeoutError):
+            await api.create(model, wait=True, timeout=1)
+        actions.create.assert_awaited_once()
+
+
+async def test_failed_write_skips_wait(make_api, actions, mocker):
+    model = ConfigMap(name="a", namespace="ns")
+    actions.delete.side_effect = client.ApiException(status=404, reason="Not Found")
+    async with make_api() as api:
+        api._action_tables[ConfigMap] = actions
+        wait_deleted = mocker.patch.object(api, "wait_deleted", mocker.AsyncMock())
+        response = await api.delete(model, wait=True)
+    assert response.code == 404
+    wait_deleted.assert_not_awaited()
+
+
+async def test_apply_forwards_options(make_api, actions, fake_response):
+    actions.patch.return_value = fake_response(dict(metadata=dict(name="a")))
+    async with make_api(field_manager="tester", force_conflicts=True) as api:
+        api._action_tables[ConfigMap] = actions
+        response = await api.apply(ConfigMap(name="a", namespace="ns"), force=False, raw=True, dry_run=True)
+    assert response == Response(code=200, raw=dict(metadata=dict(name="a")))
+    kwargs = actions.patch.await_args.kwargs
+    assert kwargs["field_manager"] == "tester"
+    assert kwargs["force"] is False
+    assert kwargs["dry_run"] == "All"
+    assert kwargs["_preload_content"] is False
+
+
+async def test_apply_errors_become_responses(make_api, actions):
+    actions.patch.side_effect = client.ApiException(status=422)
+    async with make_api() as api:
+        api._action_tables[ConfigMap] = actions
+        response = await api.apply(ConfigMap(name="a", namespace="ns"))
+    assert response.code == 422
+    assert actions.patch.await_args.kwargs["force"] is True
+    assert "dry_run" not in actions.patch.await_args.kwargs
+
+
+async def test_action_tables_are_built_once_per_model_class(make_api, mocker):
+    group = mocker.Mock(side_effect=client.CoreV1Api)
+    mocker.patch.object(ConfigMap, "_api_group", group)
+    mocker.patch.object(OpaqueSecret, "_api_group", group)
+    async with make_api() as api:
+        actions = api._actions(ConfigMap)
+        assert api._actions(ConfigMap(name="a", namespace="ns")) is actions
+        assert api._actions(OpaqueSecret) is not actions
+        assert actions.read_metadata is not None
+        assert actions.list_all is not None
+    group.assert_called_once()
+
+
+async def test_apply_all_bounds_concurrency(make_api, mocker):
+    in_flight, peak = 0, 0
+
+    async def slow_apply(*_, **__):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return Response(code=200)
+
+    registry = [ConfigMap(name=f"cm-{i}", namespace="ns") for i in range(10)]
+    async with make_api(concurrency=8) as api:
+        mocker.patch.object(api, "apply", slow_apply)
+        report = await api.apply_all(registry, concurrency=3)
+    assert peak == 3
+    assert report.ok and len(report.applied) == 10
+
+
+async def test_concurrent_reads_share_one_request(make_api, actions, fake_response):
+    async def slow_read(**_):
+        await asyncio.sleep(0.01)
+        return fake_response(dict(metadata=dict(name="a")))
+
+    actions.read.side_effect = slow_read
+    actions.read_metadata.side_effect = slow_read
+    model = ConfigMap(name="a", namespace="ns")
+    async with make_api() as api:
+        api._action_tables[ConfigMap] = actions
+        responses = await asyncio.gather(*[api.read(model, raw=True) for _ in range(3)])
+        assert all(r.raw == dict(metadata=dict(name="a")) for r in responses)
+        assert actions.read.await_count == 1
+        await asyncio.gather(*[api._read_metadata(model) for _ in range(3)])
+        assert actions.read_metadata.await_count == 1
+
+
+async def test_reads_with_different_raw_flags_are_not_shared(make_api, actions, fake_response):
+    async def slow_read(**kwargs):
+        await asyncio.sleep(0.01)
+        if kwargs.get("_preload_content") is False:
+            return fake_response(dict(metadata=dict(name="a")))
+        return dict(metadata=dict(name="a"))
+
+    actions.read.side_effect = slow_read
+    model = ConfigMap(name="a", namespace="ns")
+    async with make_api() as api:
+        api._action_tables[ConfigMap] = actions
+        await asyncio.gather(api.read(model, raw=True), api.read(model, raw=False))
+    assert actions.read.await_count == 2
+
+
+async def test_prune_keeps_cluster_scoped_custom_resources(make_api, actions, make_list_func, mocker):
+    widget = Unstructured(dict(
+        apiVersion="example.com/v1",
+        kind="Widget",
+        metadata=dict(name="w1", namespace="default")
+    ))
+    list_func, _ = make_list_func([
+        dict(metadata=dict(name="w1")),
+        dict(metadata=dict(name="w0"))
+    ], kind="WidgetList")
+    actions.list_metadata.side_effect = list_func
+    async with make_api() as api:
+        api._actions(type(widget))
+        api._action_tables[type(widget)] = actions
+        mocker.patch.object(api._api_groups[DynamicApi].discovery, "resolve", mocker.AsyncMock(
+            return_value=ApiResource("example.com/v1", "widgets", "Widget", False)
+        ))
+        mocker.patch.object(api, "delete", mocker.AsyncMock(return_value=Response(code=200)))
+        pruned = await api.prune([widget], "abc", kinds=[])
+    assert list(pruned) == [ObjectKey("Widget", None, "w0")]
+    assert [call.args[0]._values.name for call in api.delete.await_args_list] == ["w0"]
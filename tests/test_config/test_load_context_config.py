@@ -0,0 +1,102 @@
+#
+#   MIT License
+#
+#   Copyright (c) 2023, Mattias Aabmets
+#
+#   The contents of this file are subject to the terms and conditions defined in the License.
+#   You may not use, modify, or distribute this file except in compliance with the License.
+#
+#   SPDX-License-Identifier: MIT
+#
+import os
+import time
+import base64
+import orjson
+import pytest
+from pathlib import Path
+from kupydo.internal import config
+from kupydo.internal import client as client_module
+from kupydo.internal.client import ApiClient
+
+
+def make_token(expires_in: int) -> str:
+    claims = orjson.dumps(dict(exp=int(time.time()) + expires_in))
+    payload = base64.urlsafe_b64encode(claims).decode().rstrip("=")
+    return f"header.{payload}.signature"
+
+
+def write_kubeconfig(path: Path, host: str, token: str, namespace: str = None) -> None:
+    context = dict(cluster="test", user="test", **({"namespace": namespace} if namespace else {}))
+    path.write_bytes(orjson.dumps({
+        "apiVersion": "v1",
+        "kind": "Config",
+        "current-context": "test",
+        "clusters": [{"name": "test", "cluster": {"server": host}}],
+        "users": [{"name": "test", "user": {"token": token}}],
+        "contexts": [{"name": "test", "context": context}]
+    }))
+
+
+@pytest.fixture(name="kubeconfig")
+def fixture_kubeconfig(tmp_path, monkeypatch, mocker):
+    path = tmp_path / "config"
+    write_kubeconfig(path, "https://first:6443", "static-token")
+    monkeypatch.setenv("KUBECONFIG", path.as_posix())
+    mocker.patch.object(config, "load_incluster_config", side_effect=config.ConfigException)
+    config.clear_config_cache()
+    yield path
+    config.clear_config_cache()
+
+
+async def test_config_is_cached(kubeconfig):
+    first = await config.load_context_config()
+    second = await config.load_context_config("test")
+    assert first.host == "https://first:6443"
+    assert first is await config.load_context_config()
+    assert second is not first
+
+
+async def test_config_reloads_on_file_change(kubeconfig):
+    first = await config.load_context_config()
+    write_kubeconfig(kubeconfig, "https://second:6443", "static-token")
+    stat = kubeconfig.stat()
+    os.utime(kubeconfig, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    second = await config.load_context_config()
+    assert second is not first
+    assert second.host == "https://second:6443"
+
+
+async def test_expiring_token_is_refreshed_in_place(kubeconfig, mocker):
+    write_kubeconfig(kubeconfig, "https://first:6443", make_token(60))
+    cached = await config.load_context_config()
+    cache_entry = config._config_cache[None]
+    assert cache_entry.expires_at is not None
+    refresh = mocker.patch.object(cache_entry.loader, "load_and_set", mocker.AsyncMock())
+    assert await config.load_context_config() is cached
+    refresh.assert_awaited_once_with(cached)
+
+
+def test_token_expiry_of_opaque_token():
+    cfg = config.Configuration()
+    cfg.api_key["BearerToken"] = "Bearer opaque-token"
+    assert config._token_expiry(cfg, None) is None
+
+
+async def test_autoload_installs_default_for_manual_clients(kubeconfig, mocker):
+    create = mocker.patch.object(client_module, "create_session", mocker.AsyncMock())
+    try:
+        assert await config.autoload_config() is True
+        assert config.Configuration.get_default_copy().host == "https://first:6443"
+        async with ApiClient(autoconfig=False):
+            pass
+    finally:
+        config.Configuration.set_default(None)
+    assert create.await_args.args[0].host == "https://first:6443"
+    assert create.await_args.args[0] is not config._config_cache[None].config
+
+
+async def test_context_namespace_follows_kubeconfig(kubeconfig):
+    assert config.context_namespace() == "default"
+    write_kubeconfig(kubeconfig, "https://first:6443", "static-token", namespace="team")
+    await config.load_context_config()
+    assert config.context_namespace() == "team"
@@ -0,0 +1,74 @@
+#
+#   MIT License
+#
+#   Copyright (c) 2023, Mattias Aabmets
+#
+#   The contents of this file are subject to the terms and conditions defined in the License.
+#   You may not use, modify, or distribute this file except in compliance with the License.
+#
+#   SPDX-License-Identifier: MIT
+#
+import pytest
+from kupydo.internal import fanout
+from kupydo.internal.fanout import apply_to_contexts, result_matrix
+from kupydo.internal.kube_models.namespaced.configmap import ConfigMap
+from kupydo.internal.api_ops import OWNER_LABEL, ApplyReport
+from kupydo.internal.response import Response
+
+
+@pytest.fixture(name="registry")
+def fixture_registry():
+    return [
+        ConfigMap(name="a", namespace="ns", data=dict(key="1")),
+        ConfigMap(name="b", namespace="ns", data=dict(key="2"))
+    ]
+
+
+@pytest.fixture(name="clients")
+def fixture_clients(mocker):
+    created = dict()
+
+    def factory(context: str, **_):
+        client = mocker.AsyncMock()
+        client.__aenter__.return_value = client
+        if context == "broken":
+            client.__aenter__.side_effect = RuntimeError("no host")
+
+        async def apply_all(registry, **__):
+            return ApplyReport(applied={
+                model._key: Response(code=200, raw=model._render())
+                for model in registry
+            })
+
+        client.apply_all.side_effect = apply_all
+        created[context] = client
+        return client
+
+    mocker.patch("kupydo.internal.fanout.ApiClient", side_effect=factory)
+    return created
+
+
+async def test_fans_out_and_shares_rendered_manifests(registry, clients):
+    results = await apply_to_contexts(registry, ["one", "two", "broken"], deployment_id="abc")
+    assert set(results) == {"one", "two", "broken"}
+    assert results["one"].ok and results["two"].ok
+    assert not results["broken"].ok and isinstance(results["broken"].error, RuntimeError)
+
+    key = registry[0]._key
+    first, second = results["one"].report.applied[key].raw, results["two"].report.applied[key].raw
+    assert first is second
+    assert first["metadata"]["labels"] == {OWNER_LABEL: "abc"}
+    assert registry[0]._render()["metadata"].get("labels") is None
+
+
+async def test_result_matrix_rows_follow_registry(registry, clients):
+    results = await apply_to_contexts(registry, ["one", "broken"])
+    rows = result_matrix(registry, results)
+    assert [key.name for key, _ in rows] == ["a", "b"]
+    assert rows[0][1] == {"one": 200, "broken": None}
+
+
+async def test_clients_own_and_close_their_sessions(registry, clients):
+    await apply_to_contexts(registry, ["one", "two"])
+    assert all(not call.kwargs.get("shared") for call in fanout.ApiClient.call_args_list)
+    assert all(clients[ctx].__aexit__.await_count == 1 for ctx in ("one", "two"))
@@ -0,0 +1,43 @@
+#
+#   MIT License
+#
+#   Copyright (c) 2023, Mattias Aabmets
+#
+#   The contents of this file are subject to the terms and conditions defined in the License.
+#   You may not use, modify, or distribute this file except in compliance with the License.
+#
+#   SPDX-License-Identifier: MIT
+#
+from kupydo.internal.kube_models.namespaced.deployment import Deployment
+from kupydo.internal.types import ObjectKey
+from kupydo.internal import utils
+
+
+def make_deployment() -> Deployment:
+    return Deployment(
+        name="web",
+        namespace="prod",
+        replicas=3,
+        containers=[dict(
+            name="app",
+            image="nginx",
+            envFrom=[dict(configMapRef=dict(name="settings"))],
+            env=[dict(name="TOKEN", valueFrom=dict(secretKeyRef=dict(name="token", key="value")))]
+        )],
+        volumes=[dict(name="certs", secret=dict(secretName="tls"))]
+    )
+
+
+def test_references_point_to_configmaps_and_secrets():
+    assert make_deployment()._references == [
+        ObjectKey("ConfigMap", "prod", "settings"),
+        ObjectKey("Secret", "prod", "tls"),
+        ObjectKey("Secret", "prod", "token")
+    ]
+
+
+def test_parse_values_round_trips_manifest():
+    manifest = utils.to_plain_dict(make_deployment()._to_dict())
+    parsed = Deployment._from_dict(manifest)
+    assert utils.to_plain_dict(parsed._to_dict()) == manifest
+    assert manifest["spec"]["selector"] == dict(matchLabels=dict(app="web"))
@@ -0,0 +1,34 @@
+#
+#   MIT License
+#
+#   Copyright (c) 2023, Mattias Aabmets
+#
+#   The contents of this file are subject to the terms and conditions defined in the License.
+#   You may not use, modify, or distribute this file except in compliance with the License.
+#
+#   SPDX-License-Identifier: MIT
+#
+from kupydo.internal.kube_models.unstructured import Unstructured
+
+
+MANIFEST = dict(
+    apiVersion="example.com/v1",
+    kind="Widget",
+    metadata=dict(name="w", namespace="ns", labels=dict(app="web")),
+    spec=dict(size=3, parts=["a", "b"])
+)
+
+
+def test_each_kind_gets_its_own_model_class():
+    widget = Unstructured(MANIFEST)
+    assert type(widget) is Unstructured.of("example.com/v1", "Widget")
+    assert type(widget) is not Unstructured.of("example.com/v2", "Widget")
+    assert isinstance(widget, Unstructured)
+    assert widget._key == ("Widget", "ns", "w")
+
+
+def test_to_dict_round_trips_manifest():
+    widget = Unstructured(MANIFEST)
+    assert widget._to_dict() == MANIFEST
+    parsed = type(widget)._from_dict(MANIFEST)
+    assert parsed._to_dict() == MANIFEST
@@ -96,3 +96,43 @@ def test_deep_merge_replace(base, update, exclude):
         ),
         immutable=None
     ), "deep merge replace result does not equal the expected model"
+
+
+def test_compact_dict_drops_none_values():
+    result = utils.compact_dict(
+        data=DotMap(key="value"),
+        immutable=False,
+        binaryData=None
+    )
+    assert result == dict(data=DotMap(key="value"), immutable=False), \
+        "compact dict must keep falsy values and drop only None values"
+
+
+def test_manifest_hash_is_canonical():
+    first = dict(kind="ConfigMap", data=DotMap(b="2", a="1"))
+    second = dict(data=dict(a="1", b="2"), kind="ConfigMap")
+    assert utils.manifest_hash(first) == utils.manifest_hash(second), \
+        "manifest hash must not depend on key order or mapping type"
+    assert utils.manifest_hash(first) != utils.manifest_hash(dict(first, kind="Secret")), \
+        "manifest hash must change when the manifest changes"
+
+
+def test_merge_patch_contains_only_changes():
+    old = dict(
+        metadata=dict(name="cm", labels=dict(app="web", tier="back")),
+        binaryData=dict(blob="A" * 1024),
+        data=dict(first="1", second="2")
+    )
+    new = utils.to_plain_dict(dict(
+        metadata=DotMap(name="cm", labels=DotMap(app="api")),
+        binaryData=dict(blob="A" * 1024),
+        data=dict(first="1", second="3", third="4"),
+        immutable=True
+    ))
+    assert utils.merge_patch(old, new) == dict(
+        metadata=dict(labels=dict(app="api", tier=None)),
+        data=dict(second="3", third="4"),
+        immutable=True
+    ), "merge patch must contain only the changed paths"
+    assert utils.merge_patch(new, new) == dict(), \
+        "merge patch of identical manifests must be empty"